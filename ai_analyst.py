@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import datetime as _dt
-from typing import Callable, Sequence
+from typing import Callable
 
-from archeblow_service import AddressAnalysisResult, MixerMatch, Network, TransactionHop
+from archeblow_service import AddressAnalysisResult, Network
+
+# Risk levels that call for immediate attention.
+HIGH_RISK_LEVELS = frozenset({"critical", "high"})
+_RISK_DISPLAY_RU: dict[str, str] = {
+    "critical": "критический",
+    "high": "высокий",
+    "moderate": "средний",
+    "low": "низкий",
+}
 
 
 @dataclass(slots=True)
@@ -16,7 +25,7 @@ class AnalystRecommendation:
     title: str
     priority: str
     rationale: str
-    actions: Sequence[str] = field(default_factory=tuple)
+    actions: tuple[str, ...] = ()
 
 
 @dataclass(slots=True)
@@ -29,9 +38,99 @@ class AnalystBriefing:
     summary: str
     confidence: float
     risk_level: str
-    highlights: Sequence[str] = field(default_factory=tuple)
-    recommendations: Sequence[AnalystRecommendation] = field(default_factory=tuple)
-    alerts: Sequence[str] = field(default_factory=tuple)
+    highlights: tuple[str, ...] = ()
+    recommendations: tuple[AnalystRecommendation, ...] = ()
+    alerts: tuple[str, ...] = ()
+
+
+@dataclass(slots=True)
+class _BriefingContext:
+    """Aggregates derived once per briefing and shared by the ``_build_*`` helpers."""
+
+    hop_count: int
+    total_volume: float
+    counterparties: set[str]
+    last_activity: int
+    age_hours: float | None
+    recent_window: bool
+    mixer_names: set[str]
+    counterparty_count: int
+    medium_counterparties: bool
+    high_counterparties: bool
+    hops_gte_3: bool
+
+
+# Recommendations are constant data, so they are built once and shared between
+# briefings instead of being re-instantiated on every call.
+_CRITICAL_REC = AnalystRecommendation(
+    title="Немедленные меры контроля",
+    priority="Высокий",
+    rationale="Повышенный риск выявлен основным анализом.",
+    actions=(
+        "Заблокировать связанные операции до завершения ручной проверки",
+        "Создать инцидент в системе мониторинга комплаенса",
+    ),
+)
+_MODERATE_REC = AnalystRecommendation(
+    title="Расширенный мониторинг",
+    priority="Средний",
+    rationale="Риск умеренный — требуется периодический пересмотр.",
+    actions=(
+        "Добавить адрес в список наблюдения на 30 дней",
+        "Собрать дополнительные метаданные по контрагентам",
+    ),
+)
+_LOW_REC = AnalystRecommendation(
+    title="Регламентная проверка",
+    priority="Низкий",
+    rationale="Признаков повышенного риска не выявлено.",
+    actions=(
+        "Зафиксировать результат и продолжить стандартный мониторинг",
+        "Актуализировать данные профиля клиента",
+    ),
+)
+_MIXER_REC = AnalystRecommendation(
+    title="Проверка подозрительных сервисов",
+    priority="Высокий",
+    rationale="Система обнаружила совпадения с миксерами.",
+    actions=(
+        "Запросить дополнительные доказательства происхождения средств",
+        "Передать кейс в группу по расследованиям",
+    ),
+)
+_RECENT_ACTIVITY_REC = AnalystRecommendation(
+    title="Мониторинг свежих поступлений",
+    priority="Средний",
+    rationale="В течение последних 24 часов отмечена активность.",
+    actions=(
+        "Настроить оповещение при поступлении новых транзакций",
+        "Сверить поступления с легитимными источниками",
+    ),
+)
+_LARGE_VOLUME_REC = AnalystRecommendation(
+    title="Финансовый аудит",
+    priority="Высокий",
+    rationale="Кошелек показал оборот более 10 единиц валюты.",
+    actions=(
+        "Собрать информацию о происхождении крупных сумм",
+        "Сверить операции с внутренними лимитами",
+    ),
+)
+_MANY_COUNTERPARTIES_REC = AnalystRecommendation(
+    title="Анализ контрагентов",
+    priority="Средний",
+    rationale="Выявлено большое число уникальных получателей/отправителей.",
+    actions=(
+        "Кластеризовать адреса и выделить связанные группы",
+        "Проверить пересечения с санкционными списками",
+    ),
+)
+_BASE_RECS: dict[str, AnalystRecommendation] = {
+    "critical": _CRITICAL_REC,
+    "high": _CRITICAL_REC,
+    "moderate": _MODERATE_REC,
+    "low": _LOW_REC,
+}
 
 
 class ArtificialAnalyst:
@@ -54,24 +153,19 @@ class ArtificialAnalyst:
     def generate_briefing(self, result: AddressAnalysisResult) -> AnalystBriefing:
         """Return a briefing that summarises the supplied ``result``."""
 
-        hops = list(result.hops)
-        mixers = list(result.mixers)
-        total_volume = sum(abs(hop.amount) for hop in hops if hop.amount)
-        counterparties = self._collect_counterparties(result.address, hops)
-        last_activity = max((hop.timestamp for hop in hops), default=0)
-        age_hours = self._hours_since(last_activity) if last_activity else None
-        recent_window = age_hours is not None and age_hours <= 24
+        now_ts = self._now_provider()
+        ctx = self._build_context(result, now_ts)
 
-        highlights = self._build_highlights(result, mixers, counterparties, total_volume, age_hours)
-        recommendations = self._build_recommendations(result, mixers, recent_window, total_volume, counterparties)
-        alerts = self._build_alerts(result, mixers, recent_window)
-        summary = self._build_summary(result, len(hops), total_volume, recent_window)
-        confidence = self._estimate_confidence(len(hops), mixers, recent_window)
+        highlights = self._build_highlights(result, ctx)
+        recommendations = self._build_recommendations(result, ctx)
+        alerts = self._build_alerts(result, ctx)
+        summary = self._build_summary(result, ctx)
+        confidence = self._estimate_confidence(ctx)
 
         return AnalystBriefing(
             address=result.address,
             network=result.network,
-            generated_at=self._now_provider(),
+            generated_at=now_ts,
             summary=summary,
             confidence=confidence,
             risk_level=result.risk_level,
@@ -80,201 +174,115 @@ class ArtificialAnalyst:
             alerts=alerts,
         )
 
-    def _build_summary(
-        self,
-        result: AddressAnalysisResult,
-        hop_count: int,
-        total_volume: float,
-        recent_window: bool,
-    ) -> str:
-        risk_display = {
-            "critical": "критический",
-            "high": "высокий",
-            "moderate": "средний",
-            "low": "низкий",
-        }.get(result.risk_level, "неопределенный")
+    def _build_context(
+        self, result: AddressAnalysisResult, now_ts: int
+    ) -> _BriefingContext:
+        """Collect hop aggregates in a single pass over ``result.hops``."""
+
+        hops = result.hops
+        normalized = result.address.lower()
+        total_volume = 0.0
+        last_activity = 0
+        counterparties: set[str] = set()
+        add_party = counterparties.add
+        for hop in hops:
+            if hop.amount:
+                total_volume += abs(hop.amount)
+            if hop.timestamp > last_activity:
+                last_activity = hop.timestamp
+            party = hop.from_address
+            if party and party.lower() != normalized:
+                add_party(party)
+            party = hop.to_address
+            if party and party.lower() != normalized:
+                add_party(party)
+        age_hours = max(0, now_ts - last_activity) / 3600 if last_activity else None
+        hop_count = len(hops)
+        counterparty_count = len(counterparties)
+        return _BriefingContext(
+            hop_count=hop_count,
+            total_volume=total_volume,
+            counterparties=counterparties,
+            last_activity=last_activity,
+            age_hours=age_hours,
+            recent_window=age_hours is not None and age_hours <= 24,
+            mixer_names={match.mixer_name for match in result.mixers},
+            counterparty_count=counterparty_count,
+            medium_counterparties=counterparty_count >= 10,
+            high_counterparties=counterparty_count >= 15,
+            hops_gte_3=hop_count >= 3,
+        )
+
+    def _build_summary(self, result: AddressAnalysisResult, ctx: _BriefingContext) -> str:
+        risk_display = _RISK_DISPLAY_RU.get(result.risk_level, "неопределенный")
         summary_parts = [
             f"Анализ адреса {result.address} в сети {result.network.name.upper()} завершен",
             f"уровень риска оценивается как {risk_display} ({result.risk_score:.2f})",
         ]
-        if hop_count:
-            summary_parts.append(f"проанализировано транзакций: {hop_count}")
-        if total_volume:
-            summary_parts.append(f"совокупный оборот: {total_volume:.4f}")
-        if recent_window:
+        if ctx.hop_count:
+            summary_parts.append(f"проанализировано транзакций: {ctx.hop_count}")
+        if ctx.total_volume:
+            summary_parts.append(f"совокупный оборот: {ctx.total_volume:.4f}")
+        if ctx.recent_window:
             summary_parts.append("обнаружена свежая активность (последние 24 часа)")
         return ", ".join(summary_parts) + "."
 
     def _build_highlights(
-        self,
-        result: AddressAnalysisResult,
-        mixers: Sequence[MixerMatch],
-        counterparties: Sequence[str],
-        total_volume: float,
-        age_hours: float | None,
-    ) -> list[str]:
+        self, result: AddressAnalysisResult, ctx: _BriefingContext
+    ) -> tuple[str, ...]:
         highlights: list[str] = []
-        if mixers:
-            mixer_names = {match.mixer_name for match in mixers}
+        if ctx.mixer_names:
             highlights.append(
-                "Обнаружены совпадения с миксерами: " + ", ".join(sorted(mixer_names))
+                "Обнаружены совпадения с миксерами: " + ", ".join(sorted(ctx.mixer_names))
             )
         if result.notes:
             highlights.extend(result.notes)
-        if total_volume:
-            highlights.append(f"Оценочный оборот по кошельку: {total_volume:.4f}")
-        if len(counterparties) >= 10:
+        if ctx.total_volume:
+            highlights.append(f"Оценочный оборот по кошельку: {ctx.total_volume:.4f}")
+        if ctx.medium_counterparties:
             highlights.append(
-                f"Высокая сетевое взаимодействие — обнаружено {len(counterparties)} уникальных контрагентов"
+                f"Высокая сетевое взаимодействие — обнаружено {ctx.counterparty_count} уникальных контрагентов"
             )
-        if age_hours is not None:
-            highlights.append(f"Последняя активность {age_hours:.1f} часов назад")
-        return highlights
+        if ctx.age_hours is not None:
+            highlights.append(f"Последняя активность {ctx.age_hours:.1f} часов назад")
+        return tuple(highlights)
 
     def _build_recommendations(
-        self,
-        result: AddressAnalysisResult,
-        mixers: Sequence[MixerMatch],
-        recent_window: bool,
-        total_volume: float,
-        counterparties: Sequence[str],
-    ) -> list[AnalystRecommendation]:
-        recs: list[AnalystRecommendation] = []
-        if result.risk_level in {"critical", "high"}:
-            recs.append(
-                AnalystRecommendation(
-                    title="Немедленные меры контроля",
-                    priority="Высокий",
-                    rationale="Повышенный риск выявлен основным анализом.",
-                    actions=[
-                        "Заблокировать связанные операции до завершения ручной проверки",
-                        "Создать инцидент в системе мониторинга комплаенса",
-                    ],
-                )
-            )
-        elif result.risk_level == "moderate":
-            recs.append(
-                AnalystRecommendation(
-                    title="Расширенный мониторинг",
-                    priority="Средний",
-                    rationale="Риск умеренный — требуется периодический пересмотр.",
-                    actions=[
-                        "Добавить адрес в список наблюдения на 30 дней",
-                        "Собрать дополнительные метаданные по контрагентам",
-                    ],
-                )
-            )
-        else:
-            recs.append(
-                AnalystRecommendation(
-                    title="Регламентная проверка",
-                    priority="Низкий",
-                    rationale="Признаков повышенного риска не выявлено.",
-                    actions=[
-                        "Зафиксировать результат и продолжить стандартный мониторинг",
-                        "Актуализировать данные профиля клиента",
-                    ],
-                )
-            )
-
-        if mixers:
-            recs.append(
-                AnalystRecommendation(
-                    title="Проверка подозрительных сервисов",
-                    priority="Высокий",
-                    rationale="Система обнаружила совпадения с миксерами.",
-                    actions=[
-                        "Запросить дополнительные доказательства происхождения средств",
-                        "Передать кейс в группу по расследованиям",
-                    ],
-                )
-            )
-
-        if recent_window:
-            recs.append(
-                AnalystRecommendation(
-                    title="Мониторинг свежих поступлений",
-                    priority="Средний",
-                    rationale="В течение последних 24 часов отмечена активность.",
-                    actions=[
-                        "Настроить оповещение при поступлении новых транзакций",
-                        "Сверить поступления с легитимными источниками",
-                    ],
-                )
-            )
-
-        if total_volume >= 10:
-            recs.append(
-                AnalystRecommendation(
-                    title="Финансовый аудит",
-                    priority="Высокий",
-                    rationale="Кошелек показал оборот более 10 единиц валюты.",
-                    actions=[
-                        "Собрать информацию о происхождении крупных сумм",
-                        "Сверить операции с внутренними лимитами",
-                    ],
-                )
-            )
-
-        if len(counterparties) >= 15:
-            recs.append(
-                AnalystRecommendation(
-                    title="Анализ контрагентов",
-                    priority="Средний",
-                    rationale="Выявлено большое число уникальных получателей/отправителей.",
-                    actions=[
-                        "Кластеризовать адреса и выделить связанные группы",
-                        "Проверить пересечения с санкционными списками",
-                    ],
-                )
-            )
-        return recs
+        self, result: AddressAnalysisResult, ctx: _BriefingContext
+    ) -> tuple[AnalystRecommendation, ...]:
+        recs: list[AnalystRecommendation] = [
+            _BASE_RECS.get(result.risk_level, _LOW_REC)
+        ]
+        if ctx.mixer_names:
+            recs.append(_MIXER_REC)
+        if ctx.recent_window:
+            recs.append(_RECENT_ACTIVITY_REC)
+        if ctx.total_volume >= 10:
+            recs.append(_LARGE_VOLUME_REC)
+        if ctx.high_counterparties:
+            recs.append(_MANY_COUNTERPARTIES_REC)
+        return tuple(recs)
 
     def _build_alerts(
-        self,
-        result: AddressAnalysisResult,
-        mixers: Sequence[MixerMatch],
-        recent_window: bool,
-    ) -> list[str]:
+        self, result: AddressAnalysisResult, ctx: _BriefingContext
+    ) -> tuple[str, ...]:
         alerts: list[str] = []
-        if result.risk_level in {"critical", "high"}:
+        if result.risk_level in HIGH_RISK_LEVELS:
             alerts.append(
                 f"{result.address}: требуется немедленная реакция из-за высокого уровня риска"
             )
-        if mixers:
+        if ctx.mixer_names:
             alerts.append(f"{result.address}: обнаружены совпадения с миксерами")
-        if recent_window:
+        if ctx.recent_window:
             alerts.append(f"{result.address}: зафиксирована свежая активность, рекомендуется мониторинг")
-        return alerts
-
-    def _estimate_confidence(
-        self,
-        hop_count: int,
-        mixers: Sequence[MixerMatch],
-        recent_window: bool,
-    ) -> float:
-        base = 0.4 if hop_count >= 3 else 0.25
-        coverage = min(0.45, hop_count * 0.02)
-        mixer_bonus = 0.1 if mixers else 0.0
-        recency_bonus = 0.05 if recent_window else 0.0
-        return min(1.0, base + coverage + mixer_bonus + recency_bonus)
+        return tuple(alerts)
 
-    def _collect_counterparties(
-        self, address: str, hops: Sequence[TransactionHop]
-    ) -> list[str]:
-        normalized = address.lower()
-        parties: set[str] = set()
-        for hop in hops:
-            if hop.from_address and hop.from_address.lower() != normalized:
-                parties.add(hop.from_address)
-            if hop.to_address and hop.to_address.lower() != normalized:
-                parties.add(hop.to_address)
-        return sorted(parties)
-
-    def _hours_since(self, timestamp: int) -> float:
-        now = self._now_provider()
-        delta = max(0, now - timestamp)
-        return delta / 3600
+    def _estimate_confidence(self, ctx: _BriefingContext) -> float:
+        base = 0.4 if ctx.hops_gte_3 else 0.25
+        coverage = min(0.45, ctx.hop_count * 0.02)
+        mixer_bonus = 0.1 if ctx.mixer_names else 0.0
+        recency_bonus = 0.05 if ctx.recent_window else 0.0
+        return min(1.0, base + coverage + mixer_bonus + recency_bonus)
 
 
 def analyst_playbook() -> str:
@@ -295,5 +303,6 @@ __all__ = [
     "AnalystBriefing",
     "AnalystRecommendation",
     "ArtificialAnalyst",
+    "HIGH_RISK_LEVELS",
     "analyst_playbook",
 ]
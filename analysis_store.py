@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Mapping, Sequence
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from itertools import islice
+from operator import attrgetter
+import threading
+from typing import Iterator, Mapping, Sequence
 
 from PySide6 import QtCore
 
@@ -11,6 +15,9 @@ from archeblow_service import AddressAnalysisResult, Network, TransactionHop
 from ai_analyst import AnalystBriefing
 
 
+_hop_timestamp = attrgetter("timestamp")
+
+
 @dataclass(frozen=True, slots=True)
 class TransactionDigest:
     """Compact representation of a hop relevant to the analysed address."""
@@ -24,15 +31,62 @@ class TransactionDigest:
     timestamp: int
 
 
+@dataclass(frozen=True, slots=True)
+class StoreSnapshot:
+    """Dashboard aggregates captured for a single store version."""
+
+    version: int
+    metrics: Mapping[str, int]
+    distribution: Mapping[str, int]
+    recent_notes: Sequence[str]
+    analyst_alerts: Sequence[str]
+
+
+@dataclass(slots=True)
+class _StoredResult:
+    """Stored analysis together with lookups derived for dashboard queries."""
+
+    result: AddressAnalysisResult
+    address_lower: str
+    _hops: list[tuple[TransactionHop, str, str]] | None = field(default=None, init=False)
+
+    def hops_newest_first(self) -> list[tuple[TransactionHop, str, str]]:
+        """Return ``(hop, from_lower, to_lower)`` newest first, sorting on first use.
+
+        Deferring the sort means results that never reach the top of
+        ``recent_transactions`` are never sorted at all.
+        """
+
+        if self._hops is None:
+            self._hops = [
+                (hop, (hop.from_address or "").lower(), (hop.to_address or "").lower())
+                for hop in sorted(self.result.hops, key=_hop_timestamp, reverse=True)
+            ]
+        return self._hops
+
+
 class AnalysisStore(QtCore.QObject):
     """Keeps completed analyses and exposes derived aggregates."""
 
     result_added = QtCore.Signal(AddressAnalysisResult)
 
-    def __init__(self) -> None:
+    def __init__(self, *, max_history: int | None = 10_000) -> None:
+        """Create an empty store.
+
+        ``max_history`` caps how many results and briefings are retained; the
+        oldest entries are dropped first.  Pass ``None`` to keep everything.
+        """
+
         super().__init__()
-        self._results: list[AddressAnalysisResult] = []
-        self._briefings: list[AnalystBriefing] = []
+        self._results: deque[_StoredResult] = deque(maxlen=max_history)
+        self._briefings: deque[AnalystBriefing] = deque(maxlen=max_history)
+        # Lower-cased briefing addresses kept in lockstep with ``_briefings``.
+        self._briefing_addrs_lower: deque[str] = deque(maxlen=max_history)
+        self._risk_counts: Counter[str] = Counter()
+        self._version = 0
+        self._snapshot: StoreSnapshot | None = None
+        # Guards mutation against aggregate reads made from worker threads.
+        self._lock = threading.RLock()
 
     def add_result(
         self,
@@ -42,15 +96,20 @@ class AnalysisStore(QtCore.QObject):
     ) -> None:
         """Persist ``result`` and notify subscribers."""
 
-        self._results.append(result)
-        if briefing is not None:
-            self._briefings.append(briefing)
+        with self._lock:
+            if len(self._results) == self._results.maxlen:
+                self._risk_counts[self._results[0].result.risk_level] -= 1
+            self._results.append(_StoredResult(result, result.address.lower()))
+            self._risk_counts[result.risk_level] += 1
+            if briefing is not None:
+                self._append_briefing(briefing)
+            self._version += 1
         self.result_added.emit(result)
 
     def results(self) -> list[AddressAnalysisResult]:
         """Return a copy of all stored analyses."""
 
-        return list(self._results)
+        return [entry.result for entry in self._results]
 
     def briefings(self) -> list[AnalystBriefing]:
         """Return a copy of analyst briefings."""
@@ -60,43 +119,67 @@ class AnalysisStore(QtCore.QObject):
     def set_briefing(self, briefing: AnalystBriefing) -> None:
         """Append an analyst briefing to the history."""
 
-        self._briefings.append(briefing)
+        with self._lock:
+            self._append_briefing(briefing)
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever results or briefings change."""
+
+        return self._version
+
+    def snapshot(self) -> StoreSnapshot:
+        """Return dashboard aggregates, recomputed only when the store changed.
+
+        Notes and alerts are limited to the latest five entries.
+        """
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != self._version:
+                snapshot = self._snapshot = StoreSnapshot(
+                    version=self._version,
+                    metrics=self.metrics(),
+                    distribution=self.risk_distribution(),
+                    recent_notes=self.recent_notes(limit=5),
+                    analyst_alerts=self.analyst_alerts(limit=5),
+                )
+            return snapshot
 
     def briefing_for(self, address: str, network: Network) -> AnalystBriefing | None:
         """Return the latest briefing for the provided address and network."""
 
         normalized = address.lower()
-        for briefing in reversed(self._briefings):
-            if briefing.address.lower() == normalized and briefing.network == network:
+        for briefing, briefing_addr in zip(
+            reversed(self._briefings), reversed(self._briefing_addrs_lower)
+        ):
+            if briefing_addr == normalized and briefing.network == network:
                 return briefing
         return None
 
     def recent_briefings(self, limit: int = 5) -> Sequence[AnalystBriefing]:
         """Return the most recent analyst briefings."""
 
-        if not self._briefings:
-            return []
-        return list(reversed(self._briefings[-limit:]))
+        return list(islice(reversed(self._briefings), limit))
 
     def analyst_alerts(self, limit: int = 5) -> Sequence[str]:
         """Return the latest alerts raised by the analyst."""
 
-        alerts: list[str] = []
-        for briefing in reversed(self._briefings):
-            for alert in briefing.alerts:
-                alerts.append(alert)
-                if len(alerts) >= limit:
-                    return alerts
-        return alerts
+        alerts = (
+            alert for briefing in reversed(self._briefings) for alert in briefing.alerts
+        )
+        return list(islice(alerts, limit))
 
     def metrics(self) -> Mapping[str, int]:
         """Return headline metrics for the dashboard."""
 
+        counts = self._risk_counts
         total = len(self._results)
-        critical = sum(1 for item in self._results if item.risk_level == "critical")
-        high = sum(1 for item in self._results if item.risk_level == "high")
-        moderate = sum(1 for item in self._results if item.risk_level == "moderate")
-        low = sum(1 for item in self._results if item.risk_level == "low")
+        critical = counts["critical"]
+        high = counts["high"]
+        moderate = counts["moderate"]
+        low = counts["low"]
         return {
             "total": total,
             "critical": critical,
@@ -108,60 +191,65 @@ class AnalysisStore(QtCore.QObject):
     def risk_distribution(self) -> Mapping[str, int]:
         """Return count of analyses by risk level."""
 
-        distribution = {"critical": 0, "high": 0, "moderate": 0, "low": 0}
-        for result in self._results:
-            if result.risk_level in distribution:
-                distribution[result.risk_level] += 1
-        return distribution
+        counts = self._risk_counts
+        return {level: counts[level] for level in ("critical", "high", "moderate", "low")}
 
     def recent_transactions(self, limit: int = 10) -> Sequence[TransactionDigest]:
         """Return latest hops directly related to analysed addresses."""
 
-        records: list[TransactionDigest] = []
-        for result in reversed(self._results):
-            target = result.address.lower()
-            sorted_hops = sorted(result.hops, key=lambda hop: hop.timestamp, reverse=True)
-            for hop in sorted_hops:
-                direction, counterpart = self._classify_direction(target, hop)
-                if direction is None:
-                    continue
-                records.append(
-                    TransactionDigest(
-                        analysis_address=result.address,
-                        network=result.network,
-                        tx_hash=hop.tx_hash or "—",
-                        direction=direction,
-                        counterpart=counterpart,
-                        amount=hop.amount,
-                        timestamp=hop.timestamp,
-                    )
-                )
-                if len(records) >= limit:
-                    return records
-        return records
+        with self._lock:
+            return list(islice(self._iter_transactions(), limit))
 
     def recent_notes(self, limit: int = 10) -> Sequence[str]:
         """Return the latest risk notes from analyses."""
 
-        notes: list[str] = []
-        for result in reversed(self._results):
-            for note in result.notes:
-                notes.append(f"{result.address}: {note}")
-                if len(notes) >= limit:
-                    return notes
-        return notes
+        notes = (
+            f"{entry.result.address}: {note}"
+            for entry in reversed(self._results)
+            for note in entry.result.notes
+        )
+        return list(islice(notes, limit))
+
+    def _append_briefing(self, briefing: AnalystBriefing) -> None:
+        self._briefings.append(briefing)
+        self._briefing_addrs_lower.append(briefing.address.lower())
+
+    def _iter_transactions(self) -> Iterator[TransactionDigest]:
+        """Yield digests for hops touching analysed addresses, newest result first."""
+
+        for entry in reversed(self._results):
+            result = entry.result
+            for hop, from_lower, to_lower in entry.hops_newest_first():
+                direction, counterpart = self._classify_direction(
+                    entry.address_lower, from_lower, to_lower, hop
+                )
+                if direction is None:
+                    continue
+                # Positional arguments follow the ``TransactionDigest`` field order.
+                yield TransactionDigest(
+                    result.address,
+                    result.network,
+                    hop.tx_hash or "—",
+                    direction,
+                    counterpart,
+                    hop.amount,
+                    hop.timestamp,
+                )
 
     @staticmethod
-    def _classify_direction(target: str, hop: TransactionHop) -> tuple[str | None, str]:
-        """Determine direction of funds relative to the analysed ``target`` address."""
+    def _classify_direction(
+        target: str, from_lower: str, to_lower: str, hop: TransactionHop
+    ) -> tuple[str | None, str]:
+        """Determine direction of funds relative to the analysed ``target`` address.
+
+        ``target``, ``from_lower`` and ``to_lower`` are expected to be lower-cased.
+        """
 
-        from_addr = (hop.from_address or "").lower()
-        to_addr = (hop.to_address or "").lower()
-        if from_addr == target:
+        if from_lower == target:
             return "Исходящая", hop.to_address or "—"
-        if to_addr == target:
+        if to_lower == target:
             return "Входящая", hop.from_address or "—"
         return None, ""
 
 
-__all__ = ["AnalysisStore", "TransactionDigest"]
+__all__ = ["AnalysisStore", "StoreSnapshot", "TransactionDigest"]
@@ -18,14 +18,15 @@ accidentally logging raw tokens.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import ChainMap
+import functools
 import os
 from pathlib import Path
-from typing import Mapping
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
 
 
-@dataclass(frozen=True)
-class APIServiceKey:
+class APIServiceKey(NamedTuple):
     """Describes how to resolve an API key for an external service."""
 
     service_id: str
@@ -36,128 +37,166 @@ class APIServiceKey:
     def resolve(self) -> str | None:
         """Return the configured API key, preferring the environment variable."""
 
-        value = os.getenv(self.env_var)
+        try:
+            return _ENV_SNAPSHOT[self.env_var]
+        except KeyError:
+            pass
+        # Keys built outside ``API_SERVICE_KEYS`` are not in the snapshot.
+        value = _key_sources().get(self.env_var)
         if value:
-            return value.strip() or None
-        local_env = _load_local_env()
-        file_value = local_env.get(self.env_var)
-        if file_value:
-            return file_value
+            return _strip_key(value)
         return self.default_value
 
+    @classmethod
+    def invalidate(cls) -> None:
+        """Forget resolved keys; equivalent to :func:`invalidate_cache`."""
+
+        invalidate_cache()
+
     def masked(self) -> str:
         """Return the key with sensitive characters obfuscated for UI display."""
 
+        if API_SERVICE_KEYS.get(self.service_id) == self:
+            return _RAW_AND_MASKED[self.service_id][1]
+        return self._mask()
+
+    def _mask(self) -> str:
         value = self.resolve()
         if not value:
             return "—"
-        if value.upper() == "N/A":
+        # The sentinel normally arrives as the default itself, so try identity
+        # before the length-guarded case-insensitive compare.
+        if (value is self.default_value and value == "N/A") or (
+            len(value) == 3 and value.lower() == "n/a"
+        ):
             return "N/A"
-        if len(value) <= 4:
-            return "*" * len(value)
-        return f"{value[:2]}{'*' * (len(value) - 4)}{value[-2:]}"
-
-
-API_SERVICE_KEYS: Mapping[str, APIServiceKey] = {
-    "blockchain_com": APIServiceKey(
-        service_id="blockchain_com",
-        display_name="Blockchain.com API",
-        env_var="BLOCKCHAIN_COM_API_KEY",
-        default_value=None,
-    ),
-    "blockcypher": APIServiceKey(
-        service_id="blockcypher",
-        display_name="BlockCypher API",
-        env_var="BLOCKCYPHER_API_KEY",
-        default_value=None,
-    ),
-    "etherscan": APIServiceKey(
-        service_id="etherscan",
-        display_name="Etherscan",
-        env_var="ETHERSCAN_API_KEY",
-        default_value=None,
-    ),
-    "polygonscan": APIServiceKey(
-        service_id="polygonscan",
-        display_name="Polygonscan",
-        env_var="POLYGONSCAN_API_KEY",
-        default_value=None,
-    ),
-    "trongrid": APIServiceKey(
-        service_id="trongrid",
-        display_name="TronGrid",
-        env_var="TRONGRID_API_KEY",
-        default_value=None,
-    ),
-    "blockchair": APIServiceKey(
-        service_id="blockchair",
-        display_name="Blockchair",
-        env_var="BLOCKCHAIR_API_KEY",
-        default_value=None,
-    ),
-    "chainz": APIServiceKey(
-        service_id="chainz",
-        display_name="Chainz",
-        env_var="CHAINZ_API_KEY",
-        default_value=None,
-    ),
-    "coingecko": APIServiceKey(
-        service_id="coingecko",
-        display_name="CoinGecko",
-        env_var="COINGECKO_API_KEY",
-        default_value=None,
-    ),
-    "ofac_watchlist": APIServiceKey(
-        service_id="ofac_watchlist",
-        display_name="OFAC Watchlist",
-        env_var="OFAC_API_KEY",
-        default_value="N/A",
-    ),
-    "heuristic_mixer": APIServiceKey(
-        service_id="heuristic_mixer",
-        display_name="Heuristic Mixer Watchlist",
-        env_var="HEURISTIC_MIXER_TOKEN",
-        default_value="N/A",
-    ),
-    "ai_analyst": APIServiceKey(
-        service_id="ai_analyst",
-        display_name="ArcheBlow AI Analyst",
-        env_var="ARCHEBLOW_AI_ANALYST",
-        default_value="N/A",
-    ),
-    "monitoring_webhook": APIServiceKey(
-        service_id="monitoring_webhook",
-        display_name="ArcheBlow Monitoring Webhook",
-        env_var="ARCHEBLOW_MONITORING_WEBHOOK",
-        default_value=None,
-    ),
-}
+        length = len(value)
+        if length > len(_STARS) + 4:
+            return value[:2] + "*" * (length - 4) + value[-2:]
+        if length <= 4:
+            return _STARS[:length]
+        return value[:2] + _STARS[: length - 4] + value[-2:]
+
+
+# ``(service_id, display_name, env_var, default_value)`` for every supported
+# service.
+_SERVICE_SPECS: tuple[tuple[str, str, str, str | None], ...] = (
+    ("blockchain_com", "Blockchain.com API", "BLOCKCHAIN_COM_API_KEY", None),
+    ("blockcypher", "BlockCypher API", "BLOCKCYPHER_API_KEY", None),
+    ("etherscan", "Etherscan", "ETHERSCAN_API_KEY", None),
+    ("polygonscan", "Polygonscan", "POLYGONSCAN_API_KEY", None),
+    ("trongrid", "TronGrid", "TRONGRID_API_KEY", None),
+    ("blockchair", "Blockchair", "BLOCKCHAIR_API_KEY", None),
+    ("chainz", "Chainz", "CHAINZ_API_KEY", None),
+    ("coingecko", "CoinGecko", "COINGECKO_API_KEY", None),
+    ("ofac_watchlist", "OFAC Watchlist", "OFAC_API_KEY", "N/A"),
+    ("heuristic_mixer", "Heuristic Mixer Watchlist", "HEURISTIC_MIXER_TOKEN", "N/A"),
+    ("ai_analyst", "ArcheBlow AI Analyst", "ARCHEBLOW_AI_ANALYST", "N/A"),
+    ("monitoring_webhook", "ArcheBlow Monitoring Webhook", "ARCHEBLOW_MONITORING_WEBHOOK", None),
+)
+
+API_SERVICE_KEYS: Mapping[str, APIServiceKey] = MappingProxyType(
+    {spec[0]: APIServiceKey._make(spec) for spec in _SERVICE_SPECS}
+)
+
+# Service identifiers in declaration order, for loops that need no key data.
+API_SERVICE_IDS: tuple[str, ...] = tuple(spec[0] for spec in _SERVICE_SPECS)
 
 
 def get_api_key(service_id: str) -> str | None:
     """Return the raw API key for the requested service, if configured."""
 
-    entry = API_SERVICE_KEYS.get(service_id)
-    if not entry:
+    try:
+        return _RAW_AND_MASKED[service_id][0]
+    except KeyError:
         return None
-    return entry.resolve()
 
 
 def get_masked_key(service_id: str) -> str:
     """Return a masked representation of the key for safe UI rendering."""
 
-    entry = API_SERVICE_KEYS.get(service_id)
-    if not entry:
+    try:
+        return _RAW_AND_MASKED[service_id][1]
+    except KeyError:
         return "—"
-    return entry.masked()
 
 
+def get_all_raw() -> dict[str, str | None]:
+    """Return raw API keys for every service, keyed by ``service_id``."""
+
+    return {service_id: keys[0] for service_id, keys in _RAW_AND_MASKED.items()}
+
+
+def get_all_masked() -> dict[str, str]:
+    """Return masked API keys for every service, keyed by ``service_id``."""
+
+    return {service_id: keys[1] for service_id, keys in _RAW_AND_MASKED.items()}
+
+
+def invalidate_cache() -> None:
+    """Re-read env files and variables and refresh the key snapshot."""
+
+    _key_sources.cache_clear()
+    _load_local_env.cache_clear()
+    _candidate_env_files.cache_clear()
+    _rebuild_lookups()
+
+
+# Sliced to mask keys without building a fresh run of stars per call.
+_STARS = "*" * 256
+# Snapshot of the key variables and the resolved ``(raw, masked)`` keys by
+# ``service_id``.  Both are taken once at import (see the bottom of the module)
+# and refreshed only by ``invalidate_cache``.
+_ENV_SNAPSHOT: dict[str, str | None] = {}
+_RAW_AND_MASKED: dict[str, tuple[str | None, str]] = {}
+
+
+def _rebuild_lookups() -> None:
+    _ENV_SNAPSHOT.clear()
+    _ENV_SNAPSHOT.update(_read_env())
+    _RAW_AND_MASKED.clear()
+    for service_id, entry in API_SERVICE_KEYS.items():
+        _RAW_AND_MASKED[service_id] = (entry.resolve(), entry._mask())
+
+
+def _read_env() -> dict[str, str | None]:
+    """Return stripped values of every configured key variable in one pass.
+
+    Variables that are unset or empty are left out so ``resolve`` falls back to
+    the service default; whitespace-only values map to ``None``.
+    """
+
+    sources = _key_sources()
+    snapshot: dict[str, str | None] = {}
+    for _, _, env_var, _ in _SERVICE_SPECS:
+        value = sources.get(env_var)
+        if value:
+            snapshot[env_var] = _strip_key(value)
+    return snapshot
+
+
+def _strip_key(value: str) -> str | None:
+    if value[0].isspace() or value[-1].isspace():
+        return value.strip() or None
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def _key_sources() -> Mapping[str, str]:
+    """Return the lookup chain: process environment first, then local env files.
+
+    Empty environment variables are skipped so they do not hide a value set in
+    a local env file.
+    """
+
+    environ = {name: value for name, value in os.environ.items() if value}
+    return ChainMap(environ, _load_local_env())
+
+
+@functools.lru_cache(maxsize=1)
 def _load_local_env() -> Mapping[str, str]:
     """Return cached key-value pairs loaded from optional local env files."""
 
-    if hasattr(_load_local_env, "_cache"):
-        return getattr(_load_local_env, "_cache")
-
     env_data: dict[str, str] = {}
     for path in _candidate_env_files():
         if not path.exists():
@@ -177,19 +216,22 @@ def _load_local_env() -> Mapping[str, str]:
         except OSError:
             continue
 
-    setattr(_load_local_env, "_cache", env_data)
-    return env_data
+    return MappingProxyType(env_data)
 
 
-def _candidate_env_files() -> list[Path]:
-    """Return a list of files checked for local API key overrides."""
+@functools.lru_cache(maxsize=1)
+def _candidate_env_files() -> tuple[Path, ...]:
+    """Return the files checked for local API key overrides."""
 
-    base_dir = Path(__file__).resolve().parent
-    project_root = base_dir
-    for parent in base_dir.parents:
-        if (parent / "archeblow_desktop.py").exists():
-            project_root = parent
-            break
+    base_dir = Path(os.path.abspath(__file__)).parent
+    project_root = next(
+        (
+            parent
+            for parent in base_dir.parents
+            if (parent / "archeblow_desktop.py").exists()
+        ),
+        base_dir,
+    )
 
     candidates = []
     override = os.getenv("ARCHEBLOW_API_KEYS_FILE")
@@ -205,13 +247,17 @@ def _candidate_env_files() -> list[Path]:
             Path.cwd() / ".env",
         ]
     )
-    # Remove duplicates while preserving order
+    # Remove duplicates while preserving order.  Paths are only normalised
+    # lexically: resolving symlinks would stat every candidate for no benefit.
     seen: set[Path] = set()
     unique_candidates: list[Path] = []
     for path in candidates:
-        path = path.resolve()
+        path = Path(os.path.abspath(path))
         if path in seen:
             continue
         seen.add(path)
         unique_candidates.append(path)
-    return unique_candidates
+    return tuple(unique_candidates)
+
+
+_rebuild_lookups()
@@ -14,13 +14,20 @@ an asynchronous event loop via ``qasync`` so that future integrations with the
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass
 import datetime as _dt
+import functools
+import heapq
+from itertools import islice
 import math
-from typing import Iterable, Mapping, Sequence
+from operator import attrgetter, itemgetter
+from typing import Iterable, Iterator, Mapping, NamedTuple, Sequence
 
 import httpx
+import numpy as np
 from PySide6 import QtCore, QtGui, QtWidgets
 from qasync import QEventLoop, asyncSlot
 
@@ -30,20 +37,91 @@ from archeblow_service import (
     HeuristicMixerClient,
     Network,
 )
-from analysis_store import AnalysisStore
-from api_keys import API_SERVICE_KEYS, get_api_key, get_masked_key
-from ai_analyst import AnalystBriefing, ArtificialAnalyst, analyst_playbook
+from analysis_store import AnalysisStore, StoreSnapshot, TransactionDigest
+from api_keys import API_SERVICE_KEYS, get_all_masked, get_all_raw, get_api_key
+from ai_analyst import (
+    HIGH_RISK_LEVELS,
+    AnalystBriefing,
+    ArtificialAnalyst,
+    analyst_playbook,
+)
 from explorers import (
     ExplorerAPIError,
     SUPPORTED_NETWORKS,
     UnsupportedNetworkError,
     create_explorer_clients,
 )
-from monitoring import MonitoringService
+from monitoring import MonitoringEvent, MonitoringService, MonitoringWatch
 def _current_utc_timestamp() -> int:
     return int(_dt.datetime.now(_dt.timezone.utc).timestamp())
 
 
+@functools.lru_cache(maxsize=2048)
+def _format_timestamp(timestamp: int, fmt: str) -> str:
+    """Format a UTC epoch ``timestamp`` in local time using ``strftime``.
+
+    Results are memoised because refreshes re-render the same records.
+    """
+
+    return _dt.datetime.fromtimestamp(timestamp).strftime(fmt)
+
+
+@contextmanager
+def _bulk_update(table: QtWidgets.QTableWidget) -> Iterator[None]:
+    """Suspend repaints, sorting, sizing and signals while ``table`` is refilled."""
+
+    header = table.horizontalHeader()
+    modes = [header.sectionResizeMode(column) for column in range(header.count())]
+    sorting = table.isSortingEnabled()
+    table.setUpdatesEnabled(False)
+    table.setSortingEnabled(False)
+    header.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+    signals_blocked = table.blockSignals(True)
+    try:
+        yield
+    finally:
+        table.blockSignals(signals_blocked)
+        for column, mode in enumerate(modes):
+            header.setSectionResizeMode(column, mode)
+        table.setSortingEnabled(sorting)
+        table.setUpdatesEnabled(True)
+
+
+# Store and monitoring signals arrive in bursts; refreshes are coalesced by
+# single-shot timers so a burst costs one redraw.
+_REFRESH_DEBOUNCE_MS = 40
+# Sustained monitoring traffic is throttled instead, so the dashboard still
+# updates while events keep arriving.
+_MONITORING_THROTTLE_MS = 100
+
+
+def _debounce_timer(
+    parent: QtCore.QObject, slot, interval: int = _REFRESH_DEBOUNCE_MS
+) -> QtCore.QTimer:
+    """Return a single-shot timer that runs ``slot`` once a burst settles."""
+
+    timer = QtCore.QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(interval)
+    timer.timeout.connect(slot)
+    return timer
+
+
+def _fill_table(table: QtWidgets.QTableWidget, rows: Sequence[Sequence[str]]) -> None:
+    """Write ``rows`` into ``table``, reusing the cell items already present."""
+
+    with _bulk_update(table):
+        if table.rowCount() != len(rows):
+            table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                item = table.item(row, column)
+                if item is None:
+                    table.setItem(row, column, QtWidgets.QTableWidgetItem(value))
+                elif item.text() != value:
+                    item.setText(value)
+
+
 _RISK_BADGE = {
     "critical": ("Критический", "Высокий"),
     "high": ("Высокий", "Высокий"),
@@ -52,16 +130,35 @@ _RISK_BADGE = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def _risk_to_display(level: str) -> tuple[str, str]:
     return _RISK_BADGE.get(level, ("Неизвестно", "Низкий"))
 
 
+@functools.lru_cache(maxsize=None)
+def _net_upper(network: Network) -> str:
+    return network.name.upper()
+
+
+@functools.lru_cache(maxsize=None)
+def _net_title(network: Network) -> str:
+    return network.name.title()
+
+
+# Dashboard lines for analyst briefings, with and without a recommendation.
+_AI_RECOMMENDATION_FMT = "{} ({}): {} — приоритет {}".format
+_AI_SUMMARY_FMT = "{} ({}): {}".format
+
+
+_SHORT_ADDRESS_FMT = "%s…%s"
+
+
+@functools.lru_cache(maxsize=4096)
 def _short_address(value: str) -> str:
-    if len(value) <= 15:
-        return value
-    return f"{value[:6]}…{value[-4:]}"
+    return value if len(value) <= 15 else _SHORT_ADDRESS_FMT % (value[:6], value[-4:])
 
 
+@functools.lru_cache(maxsize=None)
 def _service_display_name(service_id: str) -> str:
     entry = API_SERVICE_KEYS.get(service_id)
     if entry:
@@ -69,6 +166,18 @@ def _service_display_name(service_id: str) -> str:
     return service_id
 
 
+# Service keys in display order, so tooltips need no per-refresh sort.
+_SORTED_API_SERVICE_KEYS = tuple(
+    sorted(API_SERVICE_KEYS.values(), key=attrgetter("display_name"))
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _emoji_font() -> QtGui.QFont:
+    # Built on first use: fonts need a running QGuiApplication.
+    return QtGui.QFont("Segoe UI Emoji", 18)
+
+
 _DEFAULT_MIXER_WATCHLIST: Mapping[str, str] = {
     "1Jz2Jv7wYyh9wA8Ski38p8h9Cwz9zmXo4H": "ChipMixer (public sample)",
     "bc1qwasab1example0000000000000000v2a8d0": "Wasabi Wallet Cluster",
@@ -76,8 +185,7 @@ _DEFAULT_MIXER_WATCHLIST: Mapping[str, str] = {
 }
 
 
-@dataclass(frozen=True)
-class NavItem:
+class NavItem(NamedTuple):
     """Describes an item displayed in the left navigation panel."""
 
     title: str
@@ -116,14 +224,15 @@ class NavigationButton(QtWidgets.QPushButton):
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def _create_icon(name: str) -> QtGui.QIcon:
         # Placeholder Feather-like icons created from emoji glyphs to avoid
-        # bundling assets.
+        # bundling assets.  Icons are cached per glyph and shared by buttons.
         pixmap = QtGui.QPixmap(32, 32)
         pixmap.fill(QtCore.Qt.transparent)
         painter = QtGui.QPainter(pixmap)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        painter.setFont(QtGui.QFont("Segoe UI Emoji", 18))
+        painter.setFont(_emoji_font())
         painter.drawText(pixmap.rect(), QtCore.Qt.AlignCenter, name)
         painter.end()
         return QtGui.QIcon(pixmap)
@@ -235,26 +344,28 @@ class SearchField(QtWidgets.QWidget):
 class StatsChip(QtWidgets.QFrame):
     """Compact widget that displays a headline value with context."""
 
+    # One sheet for both states; ``set_alert`` only flips the ``alert``
+    # property.  The ``QFrame`` rules also reach the chip's labels.
+    _QSS = (
+        "QFrame {"
+        " background: #161b22;"
+        " border: 1px solid #30363d;"
+        " border-radius: 12px;"
+        " }"
+        'StatsChip[alert="true"], StatsChip[alert="true"] QFrame {'
+        " background: rgba(248, 81, 73, 0.18);"
+        " border: 1px solid #f85149;"
+        " border-radius: 12px;"
+        " }"
+    )
+
     def __init__(self, title: str, icon: str | None = None) -> None:
         super().__init__()
         self._title = title
         self._icon = icon or ""
         self._alert = False
-        self._base_style = (
-            "QFrame {"
-            " background: #161b22;"
-            " border: 1px solid #30363d;"
-            " border-radius: 12px;"
-            " }"
-        )
-        self._alert_style = (
-            "QFrame {"
-            " background: rgba(248, 81, 73, 0.18);"
-            " border: 1px solid #f85149;"
-            " border-radius: 12px;"
-            " }"
-        )
-        self.setStyleSheet(self._base_style)
+        self.setProperty("alert", False)
+        self.setStyleSheet(self._QSS)
 
         layout = QtWidgets.QHBoxLayout(self)
         layout.setContentsMargins(12, 8, 12, 8)
@@ -308,7 +419,11 @@ class StatsChip(QtWidgets.QFrame):
         if self._alert == active:
             return
         self._alert = active
-        self.setStyleSheet(self._alert_style if active else self._base_style)
+        self.setProperty("alert", active)
+        style = self.style()
+        for widget in (self, *self.findChildren(QtWidgets.QLabel)):
+            style.unpolish(widget)
+            style.polish(widget)
 
 
 class StatusIndicator(QtWidgets.QFrame):
@@ -352,6 +467,8 @@ class StatusIndicator(QtWidgets.QFrame):
         self._refresh_metrics()
         self._refresh_monitoring()
         self._refresh_services()
+        self._metrics_timer = _debounce_timer(self, self._refresh_metrics)
+        self._monitoring_timer = _debounce_timer(self, self._refresh_monitoring)
         if self._store is not None:
             self._store.result_added.connect(self._on_result_added)
         if self._monitoring is not None:
@@ -365,8 +482,9 @@ class StatusIndicator(QtWidgets.QFrame):
             self.risk_chip.set_alert(False)
             return
 
-        metrics = self._store.metrics()
-        distribution = self._store.risk_distribution()
+        snapshot = self._store.snapshot()
+        metrics = snapshot.metrics
+        distribution = snapshot.distribution
         total = metrics.get("total", 0)
         critical = distribution.get("critical", 0)
         high = distribution.get("high", 0)
@@ -395,27 +513,21 @@ class StatusIndicator(QtWidgets.QFrame):
             self.api_chip.set_tooltip(None)
             return
 
-        watches = list(self._monitoring.active_watches())
+        watches = self._monitoring.active_watches()
         watch_count = len(watches)
         soon_threshold = _current_utc_timestamp() + 3 * 86_400
-        expiring_soon = sum(1 for watch in watches if watch.expires_at <= soon_threshold)
+        # ``active_watches`` is ordered by expiry, so a bisect finds the count.
+        expiring_soon = bisect_right(watches, soon_threshold, key=attrgetter("expires_at"))
         subtitle = "Под наблюдением"
         if expiring_soon:
             subtitle = f"Под наблюдением • истекает: {expiring_soon}"
         self.monitoring_chip.set_value(str(watch_count), subtitle)
         if watches:
-            tooltip_lines = []
-            for watch in watches[:6]:
-                expiry = (
-                    QtCore.QDateTime.fromSecsSinceEpoch(
-                        watch.expires_at, QtCore.QTimeZone.utc()
-                    )
-                    .toLocalTime()
-                    .toString("dd.MM HH:mm")
-                )
-                tooltip_lines.append(
-                    f"{_short_address(watch.address)} ({watch.network.name.upper()}): до {expiry}"
-                )
+            tooltip_lines = [
+                f"{_short_address(watch.address)} ({_net_upper(watch.network)}): "
+                f"до {_format_timestamp(watch.expires_at, '%d.%m %H:%M')}"
+                for watch in watches[:6]
+            ]
             if len(watches) > 6:
                 tooltip_lines.append(f"… и еще {len(watches) - 6} адрес(ов)")
             self.monitoring_chip.set_tooltip("\n".join(tooltip_lines))
@@ -438,10 +550,11 @@ class StatusIndicator(QtWidgets.QFrame):
         self.api_chip.set_alert(bool(incidents))
 
     def _refresh_services(self) -> None:
+        raw_keys = get_all_raw()
         configured: list[str] = []
         missing: list[str] = []
-        for entry in API_SERVICE_KEYS.values():
-            if entry.resolve():
+        for entry in _SORTED_API_SERVICE_KEYS:
+            if raw_keys[entry.service_id]:
                 configured.append(entry.display_name)
             else:
                 missing.append(entry.display_name)
@@ -453,23 +566,19 @@ class StatusIndicator(QtWidgets.QFrame):
         if configured or missing:
             tooltip_lines: list[str] = []
             if configured:
-                tooltip_lines.append(
-                    "Активно: " + ", ".join(sorted(configured))
-                )
+                tooltip_lines.append("Активно: " + ", ".join(configured))
             if missing:
-                tooltip_lines.append(
-                    "Нет ключей: " + ", ".join(sorted(missing))
-                )
+                tooltip_lines.append("Нет ключей: " + ", ".join(missing))
             self.services_chip.set_tooltip("\n".join(tooltip_lines))
         else:
             self.services_chip.set_tooltip(None)
         self.services_chip.set_alert(len(configured) == 0)
 
     def _on_result_added(self, _result: AddressAnalysisResult) -> None:
-        self._refresh_metrics()
+        self._metrics_timer.start()
 
     def _on_monitoring_event(self, _event: object) -> None:
-        self._refresh_monitoring()
+        self._monitoring_timer.start()
 
 
 class NotificationCenter(QtWidgets.QFrame):
@@ -483,6 +592,9 @@ class NotificationCenter(QtWidgets.QFrame):
         super().__init__()
         self._store = store
         self._monitoring = monitoring
+        self._feed = (
+            _NotificationFeed(store, monitoring) if store is not None else None
+        )
         layout = QtWidgets.QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
@@ -510,50 +622,42 @@ class NotificationCenter(QtWidgets.QFrame):
         )
         layout.addWidget(self.counter)
 
+        # Unread items since the menu was last opened, capped like the menu.
+        self._pending_count = len(self._recent_notes())
         self._update_counter()
         if self._store is not None:
             self._store.result_added.connect(self._handle_result_added)
         if self._monitoring is not None:
             self._monitoring.event_recorded.connect(self._on_monitoring_event)
-            self._monitoring.watch_added.connect(self._on_monitoring_event)
 
     def _recent_notes(self) -> Sequence[str]:
-        if self._store is None:
+        if self._feed is None:
             return []
-        notes = list(self._store.recent_notes(limit=5))
-        alerts = list(self._store.analyst_alerts(limit=5))
-        combined: list[str] = []
-        if self._monitoring is not None:
-            for event in self._monitoring.recent_events(limit=5):
-                if event.level not in {"error", "warning"}:
-                    continue
-                combined.append(self._format_monitoring_event(event))
-                if len(combined) >= 5:
-                    return combined
-        combined.extend(alerts)
-        for note in notes:
-            if len(combined) >= 5:
-                break
-            combined.append(note)
-        return combined
+        return self._feed.items()
 
     def _update_counter(self) -> None:
-        notes = self._recent_notes()
-        if not notes:
+        if not self._pending_count:
             self.counter.hide()
             return
-        self.counter.setText(str(len(notes)))
+        self.counter.setText(str(self._pending_count))
         self.counter.show()
 
-    def _handle_result_added(self, _result: AddressAnalysisResult) -> None:
+    def _bump_counter(self) -> None:
+        self._pending_count = min(self._pending_count + 1, 5)
         self._update_counter()
 
-    def _on_monitoring_event(self, _event: object) -> None:
-        self._update_counter()
+    def _handle_result_added(self, _result: AddressAnalysisResult) -> None:
+        self._bump_counter()
+
+    def _on_monitoring_event(self, event: MonitoringEvent) -> None:
+        if event.level in _ALERT_LEVELS:
+            self._bump_counter()
 
     def _show_notifications(self) -> None:
         menu = QtWidgets.QMenu(self)
         notes = self._recent_notes()
+        self._pending_count = 0
+        self._update_counter()
         if not notes:
             action = menu.addAction("Новых уведомлений нет")
             action.setEnabled(False)
@@ -565,28 +669,87 @@ class NotificationCenter(QtWidgets.QFrame):
 
     @staticmethod
     def _format_monitoring_event(event: object) -> str:
-        if not isinstance(event, dict) and not hasattr(event, "details"):
-            return str(event)
+        if isinstance(event, dict):
+            return _format_event_dict(event)
         if hasattr(event, "details"):
-            details = getattr(event, "details", {})
-            level = getattr(event, "level", "info")
-            timestamp = getattr(event, "timestamp", _current_utc_timestamp())
-            message = getattr(event, "message", "")
-        else:
-            details = event.get("details", {})
-            level = event.get("level", "info")
-            timestamp = event.get("timestamp", _current_utc_timestamp())
-            message = event.get("message", "")
-        service_name = details.get("service_name") or _service_display_name(
-            details.get("service_id", "")
-        )
-        ts_text = (
-            QtCore.QDateTime.fromSecsSinceEpoch(timestamp, QtCore.QTimeZone.utc())
-            .toLocalTime()
-            .toString("HH:mm")
+            return _format_event_obj(event)
+        return str(event)
+
+
+# Monitoring levels surfaced as notifications.
+_ALERT_LEVELS = frozenset({"error", "warning"})
+
+
+def _format_event_obj(event: MonitoringEvent) -> str:
+    return _format_event_line(event.details, event.level, event.timestamp, event.message)
+
+
+def _format_event_dict(event: Mapping[str, object]) -> str:
+    return _format_event_line(
+        event.get("details", {}),
+        event.get("level", "info"),
+        event.get("timestamp", _current_utc_timestamp()),
+        event.get("message", ""),
+    )
+
+
+def _format_event_line(
+    details: Mapping[str, object], level: str, timestamp: int, message: str
+) -> str:
+    service_name = details.get("service_name") or _service_display_name(
+        details.get("service_id", "")
+    )
+    ts_text = _format_timestamp(timestamp, "%H:%M")
+    level_display = level.upper()
+    return f"{ts_text} • [{level_display}] {service_name}: {message}"
+
+
+class _NotificationFeed:
+    """Merged monitoring alerts, analyst alerts and risk notes for display.
+
+    The merge is memoised per owner and only recomputed when the store or
+    monitoring version changes.
+    """
+
+    __slots__ = ("_store", "_monitoring", "_versions", "_items")
+
+    def __init__(
+        self, store: AnalysisStore, monitoring: MonitoringService | None
+    ) -> None:
+        self._store = store
+        self._monitoring = monitoring
+        self._versions: tuple[int, int] | None = None
+        self._items: tuple[str, ...] = ()
+
+    def items(self) -> tuple[str, ...]:
+        monitoring = self._monitoring
+        versions = (
+            self._store.version,
+            monitoring.version if monitoring is not None else 0,
         )
-        level_display = level.upper()
-        return f"{ts_text} • [{level_display}] {service_name}: {message}"
+        if versions != self._versions:
+            self._items = self._combine()
+            self._versions = versions
+        return self._items
+
+    def _combine(self) -> tuple[str, ...]:
+        # Notes and alerts in the store snapshot are already capped at five.
+        limit = 5
+        snapshot = self._store.snapshot()
+        combined: list[str] = []
+        if self._monitoring is not None:
+            for event in self._monitoring.recent_events(limit=limit):
+                if event.level not in _ALERT_LEVELS:
+                    continue
+                combined.append(NotificationCenter._format_monitoring_event(event))
+                if len(combined) >= limit:
+                    return tuple(combined)
+        combined.extend(snapshot.analyst_alerts)
+        for note in snapshot.recent_notes:
+            if len(combined) >= limit:
+                break
+            combined.append(note)
+        return tuple(combined)
 
 
 class TopBar(QtWidgets.QFrame):
@@ -626,63 +789,113 @@ class RiskDistributionWidget(QtWidgets.QWidget):
         ("low", "Низкий", "#2ea043"),
     )
 
+    # Bars are told apart by their ``risk`` property, so the sheet is parsed
+    # once instead of being rebuilt per bar on every update.
+    _QSS = """
+        QProgressBar {
+            background: #0d1117;
+            border: 1px solid #30363d;
+            border-radius: 8px;
+            text-align: center;
+            color: #c9d1d9;
+        }
+        QProgressBar::chunk {
+            border-radius: 6px;
+        }
+        """ + "".join(
+        'QProgressBar[risk="%s"]::chunk { background-color: %s; }\n' % (key, color)
+        for key, _label, color in _ORDER
+    )
+
     def __init__(self) -> None:
         super().__init__()
+        self.setStyleSheet(self._QSS)
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
 
         self._bars: dict[str, QtWidgets.QProgressBar] = {}
-        for key, label, color in self._ORDER:
+        for key, label, _color in self._ORDER:
             bar = QtWidgets.QProgressBar()
             bar.setRange(0, 100)
             bar.setValue(0)
             bar.setFormat(f"{label}: 0 (0%)")
-            bar.setStyleSheet(
-                """
-                QProgressBar {
-                    background: #0d1117;
-                    border: 1px solid #30363d;
-                    border-radius: 8px;
-                    text-align: center;
-                    color: #c9d1d9;
-                }
-                QProgressBar::chunk {
-                    border-radius: 6px;
-                }
-                """
-            )
-            bar.setProperty("chunk_color", color)
+            bar.setProperty("risk", key)
             layout.addWidget(bar)
             self._bars[key] = bar
 
     def update_distribution(self, distribution: Mapping[str, int]) -> None:
-        total = sum(distribution.values()) or 1
-        for key, label, color in self._ORDER:
+        total = sum(distribution.values())
+        double_total = 2 * total
+        for key, label, _color in self._ORDER:
             bar = self._bars[key]
             count = distribution.get(key, 0)
-            percent = int(round((count / total) * 100))
-            # Apply chunk color dynamically.
-            bar.setStyleSheet(
-                """
-                QProgressBar {
-                    background: #0d1117;
-                    border: 1px solid #30363d;
-                    border-radius: 8px;
-                    text-align: center;
-                    color: #c9d1d9;
-                }
-                QProgressBar::chunk {
-                    background-color: %s;
-                    border-radius: 6px;
-                }
-                """
-                % color
-            )
+            # Integer round-half-up of ``count / total * 100``.
+            percent = (count * 200 + total) // double_total if total else 0
             bar.setValue(percent)
             bar.setFormat(f"{label}: {count} ({percent}%)")
 
 
+# API status fields shown in the dashboard's status list.
+_API_STATUS_FIELDS = (
+    "service_id",
+    "service_name",
+    "status",
+    "failures",
+    "last_error",
+    "last_success",
+    "last_error_message",
+    "last_message",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _DashboardSnapshot:
+    """Store aggregates prepared off the GUI thread for the dashboard."""
+
+    store: StoreSnapshot
+    transaction_rows: tuple[tuple[str, ...], ...]
+
+
+class _SnapshotSignals(QtCore.QObject):
+    """Carries finished snapshots from the thread pool back to the GUI thread."""
+
+    ready = QtCore.Signal(object)
+
+
+class _DashboardSnapshotJob(QtCore.QRunnable):
+    """Reads store aggregates and formats transaction rows on a worker thread."""
+
+    def __init__(self, store: AnalysisStore, signals: _SnapshotSignals) -> None:
+        super().__init__()
+        self._store = store
+        self._signals = signals
+
+    def run(self) -> None:
+        snapshot = _DashboardSnapshot(
+            store=self._store.snapshot(),
+            transaction_rows=tuple(
+                self._transaction_row(record)
+                for record in self._store.recent_transactions(limit=10)
+            ),
+        )
+        try:
+            self._signals.ready.emit(snapshot)
+        except RuntimeError:
+            # The dashboard was destroyed while the job was running.
+            pass
+
+    @staticmethod
+    def _transaction_row(record: TransactionDigest) -> tuple[str, ...]:
+        tx_hash_raw = record.tx_hash or "—"
+        tx_hash = tx_hash_raw if len(tx_hash_raw) <= 16 else f"{tx_hash_raw[:12]}…"
+        analysis_addr = f"{_short_address(record.analysis_address)} ({_net_upper(record.network)})"
+        counterpart = _short_address(record.counterpart)
+        amount = f"{record.amount:.8f}".rstrip("0").rstrip(".") if record.amount else "0"
+        timestamp = _format_timestamp(record.timestamp, "%d.%m.%Y %H:%M")
+        return (tx_hash, analysis_addr, counterpart, amount, record.direction, timestamp)
+
+
 class DashboardPage(QtWidgets.QWidget):
     """Dashboard showing live metrics based on completed analyses."""
 
@@ -694,6 +907,7 @@ class DashboardPage(QtWidgets.QWidget):
         super().__init__()
         self._store = store
         self._monitoring = monitoring
+        self._feed = _NotificationFeed(store, monitoring)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -768,56 +982,66 @@ class DashboardPage(QtWidgets.QWidget):
         analyst_box.setLayout(analyst_layout)
         layout.addWidget(analyst_box)
 
-        self._store.result_added.connect(self._refresh)
+        self._refresh_timer = _debounce_timer(self, self._refresh)
+        self._monitoring_timer = _debounce_timer(
+            self, self._refresh_monitoring, _MONITORING_THROTTLE_MS
+        )
+        self._snapshot_signals = _SnapshotSignals(self)
+        self._snapshot_signals.ready.connect(self._apply_snapshot)
+        self._snapshot_job_running = False
+        self._refresh_pending = False
+        self._stale = False
+        # Watch and API status fields behind the last monitoring render.
+        self._monitoring_key: tuple[object, ...] | None = None
+        self._store.result_added.connect(self._on_result_added)
         if self._monitoring is not None:
             self._monitoring.event_recorded.connect(self._on_monitoring_event)
             self._monitoring.watch_added.connect(self._on_monitoring_event)
         self._refresh()
 
+    def _on_result_added(self, _result: AddressAnalysisResult) -> None:
+        self._refresh_timer.start()
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:  # noqa: N802 - Qt API
+        super().showEvent(event)
+        if self._stale:
+            self._stale = False
+            self._refresh()
+
     def _refresh(self) -> None:
-        metrics = self._store.metrics()
+        # Hidden dashboards only note that they are out of date and catch up
+        # in ``showEvent``.
+        if not self.isVisible():
+            self._stale = True
+            return
+        # Store aggregates are computed on the thread pool; a refresh requested
+        # while a job is running is folded into one follow-up job.
+        if self._snapshot_job_running:
+            self._refresh_pending = True
+            return
+        self._snapshot_job_running = True
+        QtCore.QThreadPool.globalInstance().start(
+            _DashboardSnapshotJob(self._store, self._snapshot_signals)
+        )
+
+    def _apply_snapshot(self, data: _DashboardSnapshot) -> None:
+        self._snapshot_job_running = False
         for key, label in self._metric_labels.items():
-            label.setText(str(metrics.get(key, 0)))
-        self.risk_distribution.update_distribution(self._store.risk_distribution())
-        self._refresh_transactions()
+            label.setText(str(data.store.metrics.get(key, 0)))
+        self.risk_distribution.update_distribution(data.store.distribution)
+        self._refresh_transactions(data.transaction_rows)
         self._refresh_notifications()
         self._refresh_monitoring()
         self._refresh_ai_recommendations()
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._refresh()
 
-    def _refresh_transactions(self) -> None:
-        records = self._store.recent_transactions(limit=10)
-        self.tx_table.setRowCount(len(records))
-        for row, record in enumerate(records):
-            tx_hash_raw = record.tx_hash or "—"
-            tx_hash = tx_hash_raw if len(tx_hash_raw) <= 16 else f"{tx_hash_raw[:12]}…"
-            analysis_addr = f"{_short_address(record.analysis_address)} ({record.network.name.upper()})"
-            counterpart = _short_address(record.counterpart)
-            amount = f"{record.amount:.8f}".rstrip("0").rstrip(".") if record.amount else "0"
-            timestamp = (
-                QtCore.QDateTime.fromSecsSinceEpoch(record.timestamp, QtCore.QTimeZone.utc())
-                .toLocalTime()
-                .toString("dd.MM.yyyy HH:mm")
-            )
-            values = [tx_hash, analysis_addr, counterpart, amount, record.direction, timestamp]
-            for column, value in enumerate(values):
-                self.tx_table.setItem(row, column, QtWidgets.QTableWidgetItem(value))
+    def _refresh_transactions(self, rows: Sequence[tuple[str, ...]]) -> None:
+        _fill_table(self.tx_table, rows)
 
     def _refresh_notifications(self) -> None:
-        notes = list(self._store.recent_notes(limit=5))
-        alerts = list(self._store.analyst_alerts(limit=5))
-        combined: list[str] = []
-        if self._monitoring is not None:
-            for event in self._monitoring.recent_events(limit=5):
-                if event.level not in {"error", "warning"}:
-                    continue
-                combined.append(NotificationCenter._format_monitoring_event(event))
-                if len(combined) >= 5:
-                    break
-        combined.extend(alerts)
-        for note in notes:
-            if len(combined) >= 5:
-                break
-            combined.append(note)
+        combined = self._feed.items()
 
         self.notifications_list.clear()
         if not combined:
@@ -833,28 +1057,33 @@ class DashboardPage(QtWidgets.QWidget):
             return
 
         watches = self._monitoring.active_watches()
-        self.monitoring_watch_table.setRowCount(len(watches))
-        for row, watch in enumerate(watches):
-            expiry = (
-                QtCore.QDateTime.fromSecsSinceEpoch(watch.expires_at, QtCore.QTimeZone.utc())
-                .toLocalTime()
-                .toString("dd.MM.yyyy HH:mm")
-            )
-            values = [
+        statuses = self._monitoring.api_status_snapshot()
+        key = (
+            tuple(
+                (watch.address, watch.network, watch.expires_at, watch.comment)
+                for watch in watches
+            ),
+            tuple(
+                tuple(state.get(field) for field in _API_STATUS_FIELDS)
+                for state in statuses
+            ),
+        )
+        if key == self._monitoring_key:
+            return
+        self._monitoring_key = key
+
+        watch_rows = [
+            (
                 watch.address,
-                watch.network.name.upper(),
-                expiry,
+                _net_upper(watch.network),
+                _format_timestamp(watch.expires_at, "%d.%m.%Y %H:%M"),
                 watch.comment or "—",
-            ]
-            for column, value in enumerate(values):
-                self.monitoring_watch_table.setItem(
-                    row, column, QtWidgets.QTableWidgetItem(value)
-                )
-        if not watches:
-            self.monitoring_watch_table.setRowCount(0)
+            )
+            for watch in watches
+        ]
+        _fill_table(self.monitoring_watch_table, watch_rows)
 
         self.api_status_list.clear()
-        statuses = self._monitoring.api_status_snapshot()
         if not statuses:
             self.api_status_list.addItem("API ошибок не обнаружено.")
             return
@@ -866,12 +1095,9 @@ class DashboardPage(QtWidgets.QWidget):
                 value = int(raw)
             except (TypeError, ValueError):
                 return "—"
-            return (
-                QtCore.QDateTime.fromSecsSinceEpoch(value, QtCore.QTimeZone.utc())
-                .toLocalTime()
-                .toString("dd.MM HH:mm")
-            )
+            return _format_timestamp(value, "%d.%m %H:%M")
 
+        lines: list[str] = []
         for state in statuses:
             service_name = state.get("service_name") or state.get("service_id")
             status = state.get("status", "ok")
@@ -887,10 +1113,16 @@ class DashboardPage(QtWidgets.QWidget):
             message = state.get("last_error_message") if status == "error" else state.get("last_message")
             if message:
                 detail = f"{detail} — {message}"
-            self.api_status_list.addItem(f"{prefix} {service_name}: {detail}")
+            lines.append(f"{prefix} {service_name}: {detail}")
+        self.api_status_list.addItems(lines)
 
     def _on_monitoring_event(self, _event: object) -> None:
-        self._refresh_monitoring()
+        if not self.isVisible():
+            self._stale = True
+            return
+        # Not restarted while pending: one refresh per window under load.
+        if not self._monitoring_timer.isActive():
+            self._monitoring_timer.start()
 
     def _refresh_ai_recommendations(self) -> None:
         briefings = self._store.recent_briefings(limit=5)
@@ -901,18 +1133,18 @@ class DashboardPage(QtWidgets.QWidget):
             )
             return
 
+        lines: list[str] = []
         for briefing in briefings:
+            network = _net_upper(briefing.network)
             if briefing.recommendations:
                 primary = briefing.recommendations[0]
-                text = (
-                    f"{briefing.address} ({briefing.network.name.upper()}): "
-                    f"{primary.title} — приоритет {primary.priority}"
+                text = _AI_RECOMMENDATION_FMT(
+                    briefing.address, network, primary.title, primary.priority
                 )
             else:
-                text = (
-                    f"{briefing.address} ({briefing.network.name.upper()}): {briefing.summary}"
-                )
-            self.ai_recommendations_list.addItem(text)
+                text = _AI_SUMMARY_FMT(briefing.address, network, briefing.summary)
+            lines.append(text)
+        self.ai_recommendations_list.addItems(lines)
 
     def _metric_card(
         self, title: str, icon: str
@@ -943,6 +1175,12 @@ class NewAnalysisPage(QtWidgets.QWidget):
         self._active_explorer_id: str | None = None
         self._active_address: str | None = None
         self._active_network: Network | None = None
+        self._mixer_client = HeuristicMixerClient(watchlist=_DEFAULT_MIXER_WATCHLIST)
+        # Explorer clients open a short-lived HTTP session per request, so the
+        # cached analyzers hold no connections that would need closing.
+        self._analyzer_cache: dict[
+            Network, tuple[Sequence[object], ArcheBlowAnalyzer]
+        ] = {}
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(40, 40, 40, 40)
@@ -962,7 +1200,7 @@ class NewAnalysisPage(QtWidgets.QWidget):
 
         self.network_combo = QtWidgets.QComboBox()
         for network in SUPPORTED_NETWORKS:
-            self.network_combo.addItem(network.name.title(), network)
+            self.network_combo.addItem(_net_title(network), network)
         if self.network_combo.count() == 0:
             self.network_combo.addItem("Нет доступных сетей", None)
             self.network_combo.setEnabled(False)
@@ -1046,7 +1284,7 @@ class NewAnalysisPage(QtWidgets.QWidget):
         self.progress.setValue(0)
         self.log_output.clear()
         self.log_output.append(
-            f"Старт анализа адреса {address} в сети {network.name.title()}…"
+            f"Старт анализа адреса {address} в сети {_net_title(network)}…"
         )
         self.log_output.append("Подключение к публичным API выбранной сети…")
 
@@ -1084,7 +1322,7 @@ class NewAnalysisPage(QtWidgets.QWidget):
         if self._monitoring is not None:
             self._monitoring.log(
                 "info",
-                f"Анализ адреса {address} ({network.name.upper()}) завершен успешно.",
+                f"Анализ адреса {address} ({_net_upper(network)}) завершен успешно.",
                 source="analysis_ui",
                 category="analysis",
                 details={
@@ -1101,11 +1339,7 @@ class NewAnalysisPage(QtWidgets.QWidget):
                 days=30,
                 comment="Запущено пользователем из формы нового анализа",
             )
-            expiry_text = (
-                QtCore.QDateTime.fromSecsSinceEpoch(watch.expires_at, QtCore.QTimeZone.utc())
-                .toLocalTime()
-                .toString("dd.MM.yyyy HH:mm")
-            )
+            expiry_text = _format_timestamp(watch.expires_at, "%d.%m.%Y %H:%M")
             self.log_output.append(
                 f"Адрес добавлен в мониторинг до {expiry_text}."
             )
@@ -1134,7 +1368,7 @@ class NewAnalysisPage(QtWidgets.QWidget):
 
     async def _perform_analysis(self, address: str, network: Network) -> AddressAnalysisResult:
         self.log_output.append("Запрос истории транзакций…")
-        explorers = list(create_explorer_clients(network))
+        explorers, analyzer = self._analyzer_for(network)
         primary_client = explorers[0] if explorers else None
         if primary_client is not None:
             self._active_explorer_id = getattr(primary_client, "service_id", None)
@@ -1145,11 +1379,6 @@ class NewAnalysisPage(QtWidgets.QWidget):
                 client.__class__.__name__.replace("ExplorerClient", " API"),
             )
             self.log_output.append(f"Используется {friendly_name} для получения данных…")
-        mixer_client = HeuristicMixerClient(watchlist=_DEFAULT_MIXER_WATCHLIST)
-        analyzer = ArcheBlowAnalyzer(
-            explorer_clients=list(explorers),
-            mixer_clients=[mixer_client],
-        )
         try:
             result = await analyzer.analyze(address, network)
         except ExplorerAPIError as exc:
@@ -1180,6 +1409,21 @@ class NewAnalysisPage(QtWidgets.QWidget):
             self._active_explorer_id = None
             return result
 
+    def _analyzer_for(
+        self, network: Network
+    ) -> tuple[Sequence[object], ArcheBlowAnalyzer]:
+        """Return explorer clients and an analyzer for ``network``, built once."""
+
+        cached = self._analyzer_cache.get(network)
+        if cached is None:
+            explorers = list(create_explorer_clients(network))
+            analyzer = ArcheBlowAnalyzer(
+                explorer_clients=list(explorers),
+                mixer_clients=[self._mixer_client],
+            )
+            cached = self._analyzer_cache[network] = (explorers, analyzer)
+        return cached
+
     def _handle_error(self, message: str) -> None:
         self.log_output.append(message)
         if self._monitoring is not None and self._active_explorer_id is None:
@@ -1197,6 +1441,79 @@ class NewAnalysisPage(QtWidgets.QWidget):
             )
 
 
+class AnalysesTableModel(QtCore.QAbstractTableModel):
+    """Table model for the analyses list that formats rows on first display."""
+
+    _HEADERS = (
+        "Адрес",
+        "Сеть",
+        "Риск",
+        "Статус",
+        "Последнее обновление",
+    )
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._results: Sequence[AddressAnalysisResult] = ()
+        # Formatted column strings keyed by ``id(result)``; the page keeps
+        # every result alive, so ids are never reused while cached.
+        self._row_cache: dict[int, tuple[str, ...]] = {}
+
+    def prepare(self, result: AddressAnalysisResult) -> None:
+        """Format the row for ``result`` up front, at insertion time."""
+
+        self._row_cache[id(result)] = self._format_row(result)
+
+    def set_results(self, results: Sequence[AddressAnalysisResult]) -> None:
+        self.beginResetModel()
+        self._results = results
+        self.endResetModel()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # noqa: N802 - Qt API
+        return 0 if parent.isValid() else len(self._results)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # noqa: N802 - Qt API
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def headerData(  # noqa: N802 - Qt API
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.DisplayRole,
+    ) -> object:
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self._HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> object:
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
+            return None
+        result = self._results[index.row()]
+        values = self._row_cache.get(id(result))
+        if values is None:
+            values = self._row_cache[id(result)] = self._format_row(result)
+        return values[index.column()]
+
+    @staticmethod
+    def _format_row(result: AddressAnalysisResult) -> tuple[str, ...]:
+        risk_display, _ = _risk_to_display(result.risk_level)
+        risk_percent = f"{int(round(result.risk_score * 100))}%"
+        status = (
+            "Требует внимания"
+            if result.risk_level in HIGH_RISK_LEVELS
+            else "Завершен"
+        )
+        last_seen = max((hop.timestamp for hop in result.hops), default=_current_utc_timestamp())
+        timestamp = _format_timestamp(last_seen, "%d.%m.%Y %H:%M")
+        return (
+            result.address,
+            _net_title(result.network),
+            f"{risk_display} ({risk_percent})",
+            status,
+            timestamp,
+        )
+
+
 class AnalysesPage(QtWidgets.QWidget):
     """List of analyses with filters."""
 
@@ -1219,23 +1536,16 @@ class AnalysesPage(QtWidgets.QWidget):
         self.network_filter = QtWidgets.QComboBox()
         self.network_filter.addItem("Все сети")
         for network in SUPPORTED_NETWORKS:
-            self.network_filter.addItem(network.name.title())
+            self.network_filter.addItem(_net_title(network))
         filter_bar.addWidget(QtWidgets.QLabel("Сеть:"))
         filter_bar.addWidget(self.network_filter)
         filter_bar.addStretch(1)
 
         layout.addLayout(filter_bar)
 
-        self.table = QtWidgets.QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(
-            [
-                "Адрес",
-                "Сеть",
-                "Риск",
-                "Статус",
-                "Последнее обновление",
-            ]
-        )
+        self._model = AnalysesTableModel(self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self._model)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.doubleClicked.connect(self._open_selected)
@@ -1246,12 +1556,11 @@ class AnalysesPage(QtWidgets.QWidget):
 
         self._results: list[AddressAnalysisResult] = list(self._store.results())
         self._display_results: list[AddressAnalysisResult] = []
-        self._known_networks = {
-            self.network_filter.itemText(i)
-            for i in range(self.network_filter.count())
-        }
+        # ``id()`` of high/critical results; the page keeps them all alive.
+        self._needs_attention: set[int] = set()
+        self._known_networks: set[Network] = set(SUPPORTED_NETWORKS)
         for result in self._results:
-            self._ensure_network_option(result.network)
+            self._track(result)
 
         self._refresh_table()
         self._store.result_added.connect(self._on_result_added)
@@ -1265,54 +1574,41 @@ class AnalysesPage(QtWidgets.QWidget):
 
     def _on_result_added(self, result: AddressAnalysisResult) -> None:
         self._results.append(result)
-        self._ensure_network_option(result.network)
+        self._track(result)
         self._refresh_table()
 
+    def _track(self, result: AddressAnalysisResult) -> None:
+        self._ensure_network_option(result.network)
+        self._model.prepare(result)
+        if result.risk_level in HIGH_RISK_LEVELS:
+            self._needs_attention.add(id(result))
+
     def _ensure_network_option(self, network: Network) -> None:
-        name = network.name.title()
-        if name not in self._known_networks:
-            self.network_filter.addItem(name)
-            self._known_networks.add(name)
+        if network in self._known_networks:
+            return
+        self._known_networks.add(network)
+        self.network_filter.addItem(_net_title(network))
 
     def _refresh_table(self) -> None:
+        status_filter = self.status_filter.currentText()
+        network_filter = self.network_filter.currentText()
         self._display_results = [
             result
             for result in self._results
-            if self._matches_filters(result)
+            if self._matches_filters(result, status_filter, network_filter)
         ]
-        self.table.setRowCount(len(self._display_results))
-        for row, result in enumerate(self._display_results):
-            risk_display, _ = _risk_to_display(result.risk_level)
-            risk_percent = f"{int(round(result.risk_score * 100))}%"
-            status = (
-                "Требует внимания"
-                if result.risk_level in {"high", "critical"}
-                else "Завершен"
-            )
-            last_seen = max((hop.timestamp for hop in result.hops), default=_current_utc_timestamp())
-            timestamp = (
-                QtCore.QDateTime.fromSecsSinceEpoch(last_seen, QtCore.QTimeZone.utc())
-                .toLocalTime()
-                .toString("dd.MM.yyyy HH:mm")
-            )
-            values = [
-                result.address,
-                result.network.name.title(),
-                f"{risk_display} ({risk_percent})",
-                status,
-                timestamp,
-            ]
-            for column, value in enumerate(values):
-                self.table.setItem(row, column, QtWidgets.QTableWidgetItem(value))
-
-    def _matches_filters(self, result: AddressAnalysisResult) -> bool:
-        status_filter = self.status_filter.currentText()
-        if status_filter == "Завершен" and result.risk_level in {"high", "critical"}:
-            return False
-        if status_filter == "Требует внимания" and result.risk_level not in {"high", "critical"}:
-            return False
-        network_filter = self.network_filter.currentText()
-        if network_filter != "Все сети" and result.network.name.title() != network_filter:
+        self._model.set_results(self._display_results)
+
+    def _matches_filters(
+        self, result: AddressAnalysisResult, status_filter: str, network_filter: str
+    ) -> bool:
+        if status_filter != "Все":
+            needs_attention = id(result) in self._needs_attention
+            if status_filter == "Завершен" and needs_attention:
+                return False
+            if status_filter == "Требует внимания" and not needs_attention:
+                return False
+        if network_filter != "Все сети" and _net_title(result.network) != network_filter:
             return False
         return True
 
@@ -1346,6 +1642,35 @@ class GraphEdge:
     volume: float
 
 
+# Node fill colours by risk badge, plus the outline shared by all nodes.
+_NODE_COLORS = {
+    "Высокий": QtGui.QColor("#f85149"),
+    "Средний": QtGui.QColor("#d29922"),
+    "Низкий": QtGui.QColor("#238636"),
+}
+_NODE_DEFAULT_COLOR = QtGui.QColor("#58a6ff")
+_NODE_PEN = QtGui.QPen(QtGui.QColor("#0d1117"))
+_NODE_PEN.setWidth(2)
+
+# Translucent halo drawn by every graph node.
+_HALO_RECT = QtCore.QRectF(-40, -40, 80, 80)
+_HALO_BRUSH = QtGui.QBrush(QtGui.QColor(88, 166, 255, 40))
+_HALO_PEN = QtGui.QPen(QtCore.Qt.NoPen)
+
+@functools.lru_cache(maxsize=1)
+def _node_label_font() -> tuple[QtGui.QFont, QtGui.QFontMetricsF]:
+    # Built on first use: fonts need a running QGuiApplication.
+    font = QtGui.QFont()
+    return font, QtGui.QFontMetricsF(font)
+
+
+# Edge curve control offset and arrow head geometry (sides at ±60°).
+_EDGE_BEND_Y = -40.0
+_ARROW_SIZE = 8.0
+_ARROW_COS = math.cos(math.pi / 3)
+_ARROW_SIN = math.sin(math.pi / 3)
+
+
 class GraphNodeItem(QtWidgets.QGraphicsEllipseItem):
     """Visual node with styling based on risk and category."""
 
@@ -1359,27 +1684,37 @@ class GraphNodeItem(QtWidgets.QGraphicsEllipseItem):
         )
         self.setAcceptHoverEvents(True)
         self.setZValue(1)
+        # The gradient body and halo are rasterised once and reused while
+        # panning; zooming re-renders at the new scale.
+        self.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
         self._update_brush()
 
+        font, metrics = _node_label_font()
         label = QtWidgets.QGraphicsSimpleTextItem(node.label, self)
+        label.setFont(font)
         label.setBrush(QtGui.QBrush(QtCore.Qt.white))
-        label_rect = label.boundingRect()
+        # Measured with shared metrics instead of laying out the item; the
+        # rect form honours the line break in multi-line labels.
+        label_rect = metrics.boundingRect(QtCore.QRectF(), 0, node.label)
         label.setPos(-label_rect.width() / 2, -label_rect.height() / 2)
 
     def _update_brush(self) -> None:
-        palette = {
-            "Высокий": QtGui.QColor("#f85149"),
-            "Средний": QtGui.QColor("#d29922"),
-            "Низкий": QtGui.QColor("#238636"),
-        }
-        color = palette.get(self.node.risk_level, QtGui.QColor("#58a6ff"))
+        color = _NODE_COLORS.get(self.node.risk_level, _NODE_DEFAULT_COLOR)
         gradient = QtGui.QRadialGradient(0, 0, 36)
         gradient.setColorAt(0.0, color.lighter(140))
         gradient.setColorAt(1.0, color.darker(150))
         self.setBrush(QtGui.QBrush(gradient))
-        pen = QtGui.QPen(QtGui.QColor("#0d1117"))
-        pen.setWidth(2)
-        self.setPen(pen)
+        self.setPen(_NODE_PEN)
+
+    def boundingRect(self) -> QtCore.QRectF:  # noqa: N802 - Qt API
+        return super().boundingRect().united(_HALO_RECT)
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionGraphicsItem, widget: QtWidgets.QWidget | None = None) -> None:
+        super().paint(painter, option, widget)
+        # The halo is painted over the node body, as the former child item was.
+        painter.setPen(_HALO_PEN)
+        painter.setBrush(_HALO_BRUSH)
+        painter.drawEllipse(_HALO_RECT)
 
     def hoverEnterEvent(self, event: QtWidgets.QGraphicsSceneHoverEvent) -> None:  # noqa: N802
         tooltip = (
@@ -1410,32 +1745,48 @@ class GraphEdgeItem(QtWidgets.QGraphicsPathItem):
         self.edge = edge
         self.setZValue(0)
         self.setPen(QtGui.QPen(QtGui.QColor("#58a6ff"), 1.6))
+        self.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
         self.arrow_head = QtGui.QPolygonF()
+        self._endpoints: tuple[QtCore.QPointF, QtCore.QPointF] | None = None
         self.update_geometry()
 
     def update_geometry(self) -> None:
         src = self.source_item.scenePos()
         dst = self.target_item.scenePos()
+        # QPointF equality is fuzzy, so sub-epsilon jitter keeps the cache.
+        if self._endpoints == (src, dst):
+            return
+        self._endpoints = (src, dst)
         path = QtGui.QPainterPath(src)
-        mid = (src + dst) / 2
-        offset = QtCore.QPointF(0, -40)
-        path.quadTo(mid + offset, dst)
-        self.setPath(path)
-
-        arrow_size = 8
-        line = QtCore.QLineF(self.path().pointAtPercent(0.95), self.path().pointAtPercent(1.0))
-        angle = math.radians(-line.angle())
-        dest_point = line.p2()
-        arrow_p1 = dest_point + QtCore.QPointF(
-            math.sin(angle + math.pi / 3) * arrow_size,
-            math.cos(angle + math.pi / 3) * arrow_size,
+        control = (src + dst) / 2 + QtCore.QPointF(0, _EDGE_BEND_Y)
+        path.quadTo(control, dst)
+
+        # The quadratic curve's tangent at its end is ``2 * (dst - control)``;
+        # only its direction matters, so the factor of two is dropped.
+        tx = dst.x() - control.x()
+        ty = dst.y() - control.y()
+        length = math.hypot(tx, ty)
+        if length:
+            ux, uy = tx / length, ty / length
+        else:
+            ux, uy = 1.0, 0.0
+        cos_part = _ARROW_COS * _ARROW_SIZE
+        sin_part = _ARROW_SIN * _ARROW_SIZE
+        arrow_p1 = QtCore.QPointF(
+            dst.x() + uy * cos_part + ux * sin_part,
+            dst.y() + ux * cos_part - uy * sin_part,
         )
-        arrow_p2 = dest_point + QtCore.QPointF(
-            math.sin(angle - math.pi / 3) * arrow_size,
-            math.cos(angle - math.pi / 3) * arrow_size,
+        arrow_p2 = QtCore.QPointF(
+            dst.x() + uy * cos_part - ux * sin_part,
+            dst.y() + ux * cos_part + uy * sin_part,
         )
-        arrow = QtGui.QPolygonF([dest_point, arrow_p1, arrow_p2])
-        self.arrow_head = arrow
+        # Set before ``setPath`` so the geometry change covers the arrow too;
+        # ``setPath`` also drops the cached rendering.
+        self.arrow_head = QtGui.QPolygonF([dst, arrow_p1, arrow_p2])
+        self.setPath(path)
+
+    def boundingRect(self) -> QtCore.QRectF:  # noqa: N802 - Qt API
+        return super().boundingRect().united(self.arrow_head.boundingRect())
 
     def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionGraphicsItem, widget: QtWidgets.QWidget | None = None) -> None:
         super().paint(painter, option, widget)
@@ -1519,12 +1870,19 @@ class GraphWidget(QtWidgets.QWidget):
 
         self.scene = QtWidgets.QGraphicsScene()
         self.scene.setSceneRect(-400, -300, 800, 600)
+        # Graphs are small and rebuilt wholesale, so a BSP index would cost
+        # more to maintain on insertion than it saves on hit-testing.
+        self.scene.setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
         self.view = GraphView(self.scene)
         layout.addWidget(self.view)
 
         self.nodes: dict[str, GraphNodeItem] = {}
         self.edges: list[GraphEdgeItem] = []
         self._empty_label: QtWidgets.QGraphicsTextItem | None = None
+        # Node items grouped by ``(risk_level, category)`` with each group's
+        # current visibility, so filtering touches only groups that flip.
+        self._node_groups: dict[tuple[str, str], list[GraphNodeItem]] = {}
+        self._group_visible: dict[tuple[str, str], bool] = {}
 
         self.load_graph([], [])
         self._connect_signals()
@@ -1542,6 +1900,8 @@ class GraphWidget(QtWidgets.QWidget):
         self.nodes.clear()
         self.edges.clear()
         self._empty_label = None
+        self._node_groups = {}
+        self._group_visible = {}
 
         nodes = list(nodes)
         if not nodes:
@@ -1553,14 +1913,16 @@ class GraphWidget(QtWidgets.QWidget):
             return
 
         radius = 200
-        for index, node in enumerate(nodes):
-            angle = (2 * math.pi * index) / max(len(nodes), 1)
-            x = math.cos(angle) * radius
-            y = math.sin(angle) * radius
+        angles = np.linspace(0.0, 2 * np.pi, len(nodes), endpoint=False)
+        xs = (np.cos(angles) * radius).tolist()
+        ys = (np.sin(angles) * radius).tolist()
+        for node, x, y in zip(nodes, xs, ys):
             item = GraphNodeItem(node)
             item.setPos(x, y)
             self.scene.addItem(item)
             self.nodes[node.node_id] = item
+            self._node_groups.setdefault((node.risk_level, node.category), []).append(item)
+        self._group_visible = dict.fromkeys(self._node_groups, True)
 
         for edge in edges:
             source_item = self.nodes.get(edge.source)
@@ -1573,13 +1935,6 @@ class GraphWidget(QtWidgets.QWidget):
             target_item.add_edge(edge_item)
             self.edges.append(edge_item)
 
-        for item in self.nodes.values():
-            halo = QtWidgets.QGraphicsEllipseItem(-40, -40, 80, 80)
-            halo.setBrush(QtGui.QBrush(QtGui.QColor(88, 166, 255, 40)))
-            halo.setPen(QtGui.QPen(QtCore.Qt.NoPen))
-            halo.setParentItem(item)
-            halo.setZValue(-1)
-
         self._apply_filters()
 
     def _apply_filters(self) -> None:
@@ -1589,26 +1944,50 @@ class GraphWidget(QtWidgets.QWidget):
         if not self.nodes:
             return
 
-        for node_id, item in self.nodes.items():
-            node = item.node
-            visible = True
-            if risk != "Все" and node.risk_level != risk:
-                visible = False
-            if category != "Все" and node.category != category:
-                visible = False
-            item.setVisible(visible)
-
-        for edge_item in self.edges:
-            source_visible = edge_item.source_item.isVisible()
-            target_visible = edge_item.target_item.isVisible()
-            edge_item.setVisible(source_visible and target_visible)
+        touched: list[GraphNodeItem] = []
+        for key, items in self._node_groups.items():
+            node_risk, node_category = key
+            visible = (risk == "Все" or node_risk == risk) and (
+                category == "Все" or node_category == category
+            )
+            if self._group_visible[key] == visible:
+                continue
+            self._group_visible[key] = visible
+            for item in items:
+                item.setVisible(visible)
+            touched.extend(items)
+
+        # Only edges incident to a node whose visibility flipped can change.
+        for item in touched:
+            for edge_item in item.edges:
+                edge_item.setVisible(
+                    edge_item.source_item.isVisible() and edge_item.target_item.isVisible()
+                )
 
     def load_from_analysis(self, analysis: AddressAnalysisResult) -> None:
         main_label, filter_label = _risk_to_display(analysis.risk_level)
-        total_in = sum(hop.amount for hop in analysis.hops if hop.to_address == analysis.address)
-        total_out = sum(
-            hop.amount for hop in analysis.hops if hop.from_address == analysis.address
-        )
+        address = analysis.address
+        total_in = 0.0
+        total_out = 0.0
+        # Flow to and from each counterparty, keyed by counterparty address.
+        incoming: dict[str, float] = defaultdict(float)
+        outgoing: dict[str, float] = defaultdict(float)
+        totals: dict[str, float] = defaultdict(float)
+        for hop in analysis.hops:
+            from_address = hop.from_address
+            to_address = hop.to_address
+            amount = hop.amount
+            if from_address == address:
+                total_out += amount
+                incoming[to_address] += amount
+                totals[to_address] += amount
+                if to_address == address:
+                    total_in += amount
+            elif to_address == address:
+                total_in += amount
+                outgoing[from_address] += amount
+                totals[from_address] += amount
+
         nodes: list[GraphNode] = [
             GraphNode(
                 node_id=analysis.address,
@@ -1618,49 +1997,51 @@ class GraphWidget(QtWidgets.QWidget):
                 total_flow=total_in + total_out,
             )
         ]
+        if not analysis.hops:
+            self.load_graph(nodes, [])
+            return
 
-        aggregates: dict[str, dict[str, float]] = defaultdict(lambda: {"incoming": 0.0, "outgoing": 0.0})
-        for hop in analysis.hops:
-            if hop.from_address == analysis.address:
-                aggregates[hop.to_address]["incoming"] += hop.amount
-            elif hop.to_address == analysis.address:
-                aggregates[hop.from_address]["outgoing"] += hop.amount
-
-        sorted_counterparties = sorted(
-            aggregates.items(),
-            key=lambda item: item[1]["incoming"] + item[1]["outgoing"],
-            reverse=True,
-        )
+        top_nodes = [
+            (
+                counterparty,
+                _short_address(counterparty),
+                incoming.get(counterparty, 0.0),
+                outgoing.get(counterparty, 0.0),
+                total_flow,
+            )
+            for counterparty, total_flow in heapq.nlargest(
+                12, totals.items(), key=itemgetter(1)
+            )
+        ]
 
         edges: list[GraphEdge] = []
-        for counterparty, flow in sorted_counterparties[:12]:
-            total_flow = flow["incoming"] + flow["outgoing"]
+        for counterparty, label, flow_in, flow_out, total_flow in top_nodes:
             risk_level = "Средний" if total_flow > 1.0 else "Низкий"
             nodes.append(
                 GraphNode(
                     node_id=counterparty,
-                    label=_short_address(counterparty),
+                    label=label,
                     category="Wallet",
                     risk_level=risk_level,
                     total_flow=total_flow,
                 )
             )
-            if flow["incoming"] > 0:
+            if flow_in > 0:
                 edges.append(
                     GraphEdge(
                         source=analysis.address,
                         target=counterparty,
                         relation="Вывод",
-                        volume=flow["incoming"],
+                        volume=flow_in,
                     )
                 )
-            if flow["outgoing"] > 0:
+            if flow_out > 0:
                 edges.append(
                     GraphEdge(
                         source=counterparty,
                         target=analysis.address,
                         relation="Ввод",
-                        volume=flow["outgoing"],
+                        volume=flow_out,
                     )
                 )
 
@@ -1676,6 +2057,10 @@ class GraphWidget(QtWidgets.QWidget):
 
 
 
+# Placeholder row for analyses without transactions.
+_EMPTY_TRANSACTION_ROW = ("—", "Нет данных", "", "", "", "")
+
+
 class AnalysisDetailPage(QtWidgets.QWidget):
     """Detailed view with tabs for overview, graph, transactions, forecasts, report."""
 
@@ -1710,6 +2095,13 @@ class AnalysisDetailPage(QtWidgets.QWidget):
 
         self.current_analysis: AddressAnalysisResult | None = None
         self.current_briefing: AnalystBriefing | None = None
+        self._monitoring_timer = _debounce_timer(self, self._refresh_monitoring_section)
+        # ``(address, network)`` -> (monitoring version, watches, events), kept
+        # in least-recently-used order.
+        self._monitoring_cache: OrderedDict[
+            tuple[str, Network],
+            tuple[int, Sequence[MonitoringWatch], Sequence[MonitoringEvent]],
+        ] = OrderedDict()
         if self._monitoring is not None:
             self._monitoring.event_recorded.connect(self._on_monitoring_event)
             self._monitoring.watch_added.connect(self._on_monitoring_event)
@@ -1723,7 +2115,7 @@ class AnalysisDetailPage(QtWidgets.QWidget):
         risk_display, _ = _risk_to_display(analysis.risk_level)
         updated_time = QtCore.QDateTime.currentDateTime().toString("dd.MM.yyyy HH:mm:ss")
         self.header.setText(
-            f"Адрес: {analysis.address} | Сеть: {analysis.network.name.title()} | Обновлено: {updated_time}"
+            f"Адрес: {analysis.address} | Сеть: {_net_title(analysis.network)} | Обновлено: {updated_time}"
         )
 
         score_percent = max(0, min(100, int(round(analysis.risk_score * 100))))
@@ -1830,7 +2222,11 @@ class AnalysisDetailPage(QtWidgets.QWidget):
             if stored is not None:
                 return stored
         if self._analyst is not None:
-            return self._analyst.generate_briefing(analysis)
+            generated = self._analyst.generate_briefing(analysis)
+            # Keep it so reopening the analysis finds it via ``briefing_for``.
+            if self._store is not None:
+                self._store.set_briefing(generated)
+            return generated
         return None
 
     def _render_briefing(self, briefing: AnalystBriefing | None) -> None:
@@ -1852,23 +2248,23 @@ class AnalysisDetailPage(QtWidgets.QWidget):
         )
 
         if briefing.recommendations:
+            actions: list[str] = []
             for item in briefing.recommendations:
                 actions_text = "; ".join(item.actions) if item.actions else "Дополнительные действия не требуются"
-                self.ai_actions.addItem(
+                actions.append(
                     f"[{item.priority}] {item.title} — {item.rationale}. Действия: {actions_text}"
                 )
+            self.ai_actions.addItems(actions)
         else:
             self.ai_actions.addItem("Рекомендации не требуются.")
 
         if briefing.highlights:
-            for highlight in briefing.highlights:
-                self.ai_highlights.addItem(highlight)
+            self.ai_highlights.addItems(list(briefing.highlights))
         else:
             self.ai_highlights.addItem("Дополнительных фактов не выявлено.")
 
         if briefing.alerts:
-            for alert in briefing.alerts:
-                self.ai_alerts.addItem(alert)
+            self.ai_alerts.addItems(list(briefing.alerts))
         else:
             self.ai_alerts.addItem("Тревожных событий не обнаружено.")
 
@@ -1881,43 +2277,65 @@ class AnalysisDetailPage(QtWidgets.QWidget):
             self.monitoring_events.addItem("Мониторинг недоступен.")
             return
 
-        watches = self._monitoring.watch_for(analysis.address, analysis.network)
+        watches, events = self._monitoring_records(analysis)
         if not watches:
             self.monitoring_status.setText("Адрес не находится под активным мониторингом.")
         else:
             parts = []
             for watch in watches:
-                expiry = (
-                    QtCore.QDateTime.fromSecsSinceEpoch(
-                        watch.expires_at, QtCore.QTimeZone.utc()
-                    )
-                    .toLocalTime()
-                    .toString("dd.MM.yyyy HH:mm")
-                )
+                expiry = _format_timestamp(watch.expires_at, "%d.%m.%Y %H:%M")
                 parts.append(f"до {expiry}")
             self.monitoring_status.setText(
                 "Активный мониторинг: " + ", ".join(parts)
             )
 
-        events = self._monitoring.events_for(analysis.address, analysis.network, limit=5)
         self.monitoring_events.clear()
         if not events:
             self.monitoring_events.addItem("Журнал событий пуст.")
             return
+        lines: list[str] = []
         for event in events:
-            ts_text = (
-                QtCore.QDateTime.fromSecsSinceEpoch(event.timestamp, QtCore.QTimeZone.utc())
-                .toLocalTime()
-                .toString("dd.MM HH:mm")
-            )
+            ts_text = _format_timestamp(event.timestamp, "%d.%m %H:%M")
             service_name = event.details.get("service_name") or _service_display_name(
                 event.details.get("service_id", event.source)
             )
-            self.monitoring_events.addItem(
+            lines.append(
                 f"{ts_text}: [{event.level.upper()}] {service_name} — {event.message}"
             )
+        self.monitoring_events.addItems(lines)
+
+    def _monitoring_records(
+        self, analysis: AddressAnalysisResult
+    ) -> tuple[Sequence[MonitoringWatch], Sequence[MonitoringEvent]]:
+        """Return active watches and the latest events for ``analysis``.
+
+        Query results are reused until the monitoring version changes; only
+        the expiry check is repeated, since watches lapse without an event.
+        """
+
+        version = self._monitoring.version
+        key = (analysis.address, analysis.network)
+        cached = self._monitoring_cache.get(key)
+        if cached is not None and cached[0] == version:
+            self._monitoring_cache.move_to_end(key)
+        else:
+            cached = (
+                version,
+                self._monitoring.watch_for(analysis.address, analysis.network),
+                self._monitoring.events_for(analysis.address, analysis.network, limit=5),
+            )
+            self._monitoring_cache[key] = cached
+            self._monitoring_cache.move_to_end(key)
+            if len(self._monitoring_cache) > 32:
+                self._monitoring_cache.popitem(last=False)
+        _version, watches, events = cached
+        now = _current_utc_timestamp()
+        return [watch for watch in watches if watch.expires_at >= now], events
 
     def _on_monitoring_event(self, _event: object) -> None:
+        self._monitoring_timer.start()
+
+    def _refresh_monitoring_section(self) -> None:
         if self.current_analysis is not None:
             self._render_monitoring_section(self.current_analysis)
 
@@ -1959,40 +2377,43 @@ class AnalysisDetailPage(QtWidgets.QWidget):
         return widget
 
     def _populate_transactions(self, analysis: AddressAnalysisResult) -> None:
-        hops = list(analysis.hops)[:200]
-        self.transactions_table.setRowCount(len(hops))
+        with _bulk_update(self.transactions_table):
+            if not analysis.hops:
+                self.transactions_table.setRowCount(1)
+                for column, value in enumerate(_EMPTY_TRANSACTION_ROW):
+                    self.transactions_table.setItem(0, column, QtWidgets.QTableWidgetItem(value))
+                return
+
+            hops = list(islice(analysis.hops, 200))
+            self.transactions_table.setRowCount(len(hops))
+
+            mixer_addresses: frozenset[str] = frozenset()
+            if analysis.mixers:
+                mixer_addresses = frozenset(
+                    value
+                    for value in (match.evidence.get("match") for match in analysis.mixers)
+                    if isinstance(value, str)
+                )
+            address = analysis.address
+            set_item = self.transactions_table.setItem
+            amount_alignment = QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter
+            timestamps = [
+                _format_timestamp(hop.timestamp, "%Y-%m-%d %H:%M") for hop in hops
+            ]
 
-        mixer_addresses = {
-            str(match.evidence.get("match"))
-            for match in analysis.mixers
-            if isinstance(match.evidence.get("match"), str)
-        }
+            for row, hop in enumerate(hops):
+                amount_item = QtWidgets.QTableWidgetItem(f"{hop.amount:.8f}")
+                amount_item.setTextAlignment(amount_alignment)
 
-        for row, hop in enumerate(hops):
-            amount_item = QtWidgets.QTableWidgetItem(f"{hop.amount:.8f}")
-            amount_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-
-            direction = "Исходящая" if hop.from_address == analysis.address else "Входящая"
-            flag = "Миксер" if hop.to_address in mixer_addresses or hop.from_address in mixer_addresses else "-"
-            timestamp = QtCore.QDateTime.fromSecsSinceEpoch(
-                hop.timestamp, QtCore.QTimeZone.utc()
-            ).toLocalTime()
-
-            self.transactions_table.setItem(row, 0, QtWidgets.QTableWidgetItem(hop.tx_hash))
-            self.transactions_table.setItem(row, 1, QtWidgets.QTableWidgetItem(_short_address(hop.from_address)))
-            self.transactions_table.setItem(row, 2, QtWidgets.QTableWidgetItem(_short_address(hop.to_address)))
-            self.transactions_table.setItem(row, 3, amount_item)
-            self.transactions_table.setItem(row, 4, QtWidgets.QTableWidgetItem(flag if flag != "-" else direction))
-            self.transactions_table.setItem(row, 5, QtWidgets.QTableWidgetItem(timestamp.toString("yyyy-MM-dd HH:mm")))
-
-        if not hops:
-            self.transactions_table.setRowCount(1)
-            self.transactions_table.setItem(0, 0, QtWidgets.QTableWidgetItem("—"))
-            self.transactions_table.setItem(0, 1, QtWidgets.QTableWidgetItem("Нет данных"))
-            self.transactions_table.setItem(0, 2, QtWidgets.QTableWidgetItem(""))
-            self.transactions_table.setItem(0, 3, QtWidgets.QTableWidgetItem(""))
-            self.transactions_table.setItem(0, 4, QtWidgets.QTableWidgetItem(""))
-            self.transactions_table.setItem(0, 5, QtWidgets.QTableWidgetItem(""))
+                direction = "Исходящая" if hop.from_address == address else "Входящая"
+                flag = "Миксер" if hop.to_address in mixer_addresses or hop.from_address in mixer_addresses else "-"
+
+                set_item(row, 0, QtWidgets.QTableWidgetItem(hop.tx_hash))
+                set_item(row, 1, QtWidgets.QTableWidgetItem(_short_address(hop.from_address)))
+                set_item(row, 2, QtWidgets.QTableWidgetItem(_short_address(hop.to_address)))
+                set_item(row, 3, amount_item)
+                set_item(row, 4, QtWidgets.QTableWidgetItem(flag if flag != "-" else direction))
+                set_item(row, 5, QtWidgets.QTableWidgetItem(timestamps[row]))
 
     def _create_forecast_tab(self) -> QtWidgets.QWidget:
         widget = QtWidgets.QWidget()
@@ -2096,13 +2517,22 @@ class IntegrationsPage(QtWidgets.QWidget):
             "Лимит",
             "Действия",
         ])
-        for row, (service_id, status, limit, action) in enumerate(services):
-            entry = API_SERVICE_KEYS.get(service_id)
-            name = entry.display_name if entry else service_id
-            masked_key = get_masked_key(service_id)
-            values = [name, status, masked_key, limit, action]
-            for column, value in enumerate(values):
-                table.setItem(row, column, QtWidgets.QTableWidgetItem(value))
+        masked_keys = get_all_masked()
+        rows = [
+            (
+                _service_display_name(service_id),
+                status,
+                masked_keys.get(service_id, "—"),
+                limit,
+                action,
+            )
+            for service_id, status, limit, action in services
+        ]
+        set_item = table.setItem
+        with _bulk_update(table):
+            for row, values in enumerate(rows):
+                for column, value in enumerate(values):
+                    set_item(row, column, QtWidgets.QTableWidgetItem(value))
         table.horizontalHeader().setStretchLastSection(True)
         layout.addWidget(table)
 
@@ -2255,6 +2685,35 @@ class SettingsPage(QtWidgets.QWidget):
         layout.addWidget(save_button, alignment=QtCore.Qt.AlignRight)
 
 
+# Application-wide sheet, installed once on the QApplication in ``main`` so it
+# is parsed a single time rather than re-polishing the window's widget tree.
+_APP_QSS = """
+    QMainWindow { background-color: #010409; }
+    QLabel { color: #c9d1d9; }
+    QGroupBox { color: #c9d1d9; border: 1px solid #30363d; border-radius: 12px; padding: 16px; }
+    QTabBar::tab { background: #161b22; padding: 8px 16px; border: 1px solid #30363d; border-bottom: none; }
+    QTabBar::tab:selected { background: #1f6feb; color: #ffffff; }
+    QTabWidget::pane { border: 1px solid #30363d; border-radius: 0 0 12px 12px; }
+    QListWidget, QTextEdit, QPlainTextEdit { background: #0d1117; border: 1px solid #30363d; border-radius: 12px; color: #c9d1d9; }
+    QTableView { background: #0d1117; border: 1px solid #30363d; border-radius: 12px; gridline-color: #30363d; }
+    QHeaderView::section { background: #161b22; color: #8b949e; border: none; padding: 6px; }
+    QPushButton { color: #c9d1d9; }
+    QComboBox, QSpinBox, QDoubleSpinBox, QDateEdit, QTimeEdit { background: #161b22; border: 1px solid #30363d; border-radius: 8px; color: #c9d1d9; padding: 6px; }
+    QCheckBox { color: #c9d1d9; }
+    """
+
+
+class _AnalysisDoneEvent(QtCore.QEvent):
+    """Posted after an analysis completes to switch pages from the event loop."""
+
+    TYPE = QtCore.QEvent.Type(QtCore.QEvent.registerEventType())
+
+    def __init__(self, analysis: AddressAnalysisResult, briefing: AnalystBriefing) -> None:
+        super().__init__(self.TYPE)
+        self.analysis = analysis
+        self.briefing = briefing
+
+
 class MainWindow(QtWidgets.QMainWindow):
     """Top-level window that composes all application sections."""
 
@@ -2315,6 +2774,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.pages.addWidget(self.reports_page)
         self.pages.addWidget(self.settings_page)
         content_layout.addWidget(self.pages)
+        self._page_map: dict[str, QtWidgets.QWidget] = {
+            "dashboard": self.dashboard_page,
+            "new_analysis": self.new_analysis_page,
+            "analyses": self.analyses_page,
+            "integrations": self.integrations_page,
+            "reports": self.reports_page,
+            "settings": self.settings_page,
+        }
 
         root_layout.addWidget(content_area)
 
@@ -2324,6 +2791,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.new_analysis_page.analysis_completed.connect(self._analysis_completed)
         self.analyses_page.open_details.connect(self._open_analysis_details)
 
+        self._completion_box: QtWidgets.QMessageBox | None = None
         self._style_application()
 
     def _style_application(self) -> None:
@@ -2341,33 +2809,9 @@ class MainWindow(QtWidgets.QMainWindow):
         palette.setColor(QtGui.QPalette.Highlight, QtGui.QColor("#1f6feb"))
         palette.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor("#ffffff"))
         self.setPalette(palette)
-        self.setStyleSheet(
-            """
-            QMainWindow { background-color: #010409; }
-            QLabel { color: #c9d1d9; }
-            QGroupBox { color: #c9d1d9; border: 1px solid #30363d; border-radius: 12px; padding: 16px; }
-            QTabBar::tab { background: #161b22; padding: 8px 16px; border: 1px solid #30363d; border-bottom: none; }
-            QTabBar::tab:selected { background: #1f6feb; color: #ffffff; }
-            QTabWidget::pane { border: 1px solid #30363d; border-radius: 0 0 12px 12px; }
-            QListWidget, QTextEdit, QPlainTextEdit { background: #0d1117; border: 1px solid #30363d; border-radius: 12px; color: #c9d1d9; }
-            QTableWidget { background: #0d1117; border: 1px solid #30363d; border-radius: 12px; gridline-color: #30363d; }
-            QHeaderView::section { background: #161b22; color: #8b949e; border: none; padding: 6px; }
-            QPushButton { color: #c9d1d9; }
-            QComboBox, QSpinBox, QDoubleSpinBox, QDateEdit, QTimeEdit { background: #161b22; border: 1px solid #30363d; border-radius: 8px; color: #c9d1d9; padding: 6px; }
-            QCheckBox { color: #c9d1d9; }
-            """
-        )
 
     def _switch_page(self, page_id: str) -> None:
-        mapping = {
-            "dashboard": self.dashboard_page,
-            "new_analysis": self.new_analysis_page,
-            "analyses": self.analyses_page,
-            "integrations": self.integrations_page,
-            "reports": self.reports_page,
-            "settings": self.settings_page,
-        }
-        widget = mapping.get(page_id)
+        widget = self._page_map.get(page_id)
         if widget is not None:
             self.pages.setCurrentWidget(widget)
 
@@ -2386,24 +2830,39 @@ class MainWindow(QtWidgets.QMainWindow):
             recommendation_line = (
                 f"\nРекомендация аналитика: {primary.title} (приоритет {primary.priority})."
             )
-        QtWidgets.QMessageBox.information(
-            self,
-            "Анализ завершен",
-            (
-                f"Анализ адреса {analysis.address} ({analysis.network.name.title()}) завершен.\n"
-                f"Итоговый уровень риска: {risk_display}."
-                f"{recommendation_line}"
-            ),
+        if self._completion_box is None:
+            self._completion_box = QtWidgets.QMessageBox(
+                QtWidgets.QMessageBox.Information,
+                "Анализ завершен",
+                "",
+                QtWidgets.QMessageBox.Ok,
+                self,
+            )
+            self._completion_box.setWindowModality(QtCore.Qt.NonModal)
+        self._completion_box.setText(
+            f"Анализ адреса {analysis.address} ({_net_title(analysis.network)}) завершен.\n"
+            f"Итоговый уровень риска: {risk_display}."
+            f"{recommendation_line}"
         )
-        self.detail_page.set_analysis(analysis, briefing)
-        self.navigation.set_active("analyses")
-        self.pages.setCurrentWidget(self.analyses_page)
+        # A non-modal box avoids a nested event loop; navigation follows once
+        # control is back in the main loop.
+        self._completion_box.show()
+        QtCore.QCoreApplication.postEvent(self, _AnalysisDoneEvent(analysis, briefing))
+
+    def event(self, event: QtCore.QEvent) -> bool:
+        if event.type() == _AnalysisDoneEvent.TYPE:
+            self.detail_page.set_analysis(event.analysis, event.briefing)
+            self.navigation.set_active("analyses")
+            self.pages.setCurrentWidget(self.analyses_page)
+            return True
+        return super().event(event)
 
     def _open_analysis_details(self, analysis: AddressAnalysisResult) -> None:
-        briefing = self.store.briefing_for(analysis.address, analysis.network)
-        self.detail_page.set_analysis(analysis, briefing)
-        if self.pages.indexOf(self.detail_page) == -1:
-            self.pages.addWidget(self.detail_page)
+        # Reopening the result already on the detail page keeps its contents;
+        # monitoring updates reach the page through its own signals.
+        if analysis is not self.detail_page.current_analysis:
+            briefing = self.store.briefing_for(analysis.address, analysis.network)
+            self.detail_page.set_analysis(analysis, briefing)
         self.pages.setCurrentWidget(self.detail_page)
 
 
@@ -2411,6 +2870,10 @@ def main() -> None:
     """Entry point that starts the Qt application with qasync."""
 
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app.setStyleSheet(_APP_QSS)
+    # qasync's QEventLoop is the asyncio loop here and is driven by Qt's own
+    # dispatcher, so alternative loop policies such as uvloop/winloop cannot
+    # take over; installing one would only affect loops created elsewhere.
     loop = QEventLoop(app)
     asyncio.set_event_loop(loop)
 
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
 import datetime as _dt
+from operator import attrgetter
 from typing import Mapping, MutableMapping, Sequence
 
 import httpx
@@ -14,6 +16,9 @@ from archeblow_service import Network
 from api_keys import API_SERVICE_KEYS
 
 
+_watch_expiry = attrgetter("expires_at")
+
+
 def _current_timestamp() -> int:
     return int(_dt.datetime.now(_dt.timezone.utc).timestamp())
 
@@ -95,7 +100,10 @@ class MonitoringService(QtCore.QObject):
         super().__init__()
         self._events: list[MonitoringEvent] = []
         self._watches: MutableMapping[tuple[str, Network], MonitoringWatch] = {}
+        # The same watches ordered by expiry, maintained with ``insort``.
+        self._watches_by_expiry: list[MonitoringWatch] = []
         self._api_state: MutableMapping[str, dict[str, object]] = {}
+        self._version = 0
         self._webhook = (
             WebhookNotifier(webhook_url, session=session) if webhook_url else None
         )
@@ -103,6 +111,12 @@ class MonitoringService(QtCore.QObject):
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever an event is recorded or a watch is added."""
+
+        return self._version
+
     def log(
         self,
         level: str,
@@ -229,7 +243,12 @@ class MonitoringService(QtCore.QObject):
             expires_at=expires_at,
             comment=comment or "",
         )
+        previous = self._watches.get(key)
+        if previous is not None:
+            self._watches_by_expiry.remove(previous)
         self._watches[key] = watch
+        insort(self._watches_by_expiry, watch, key=_watch_expiry)
+        self._version += 1
         self.watch_added.emit(watch)
         self.log(
             "info",
@@ -248,9 +267,11 @@ class MonitoringService(QtCore.QObject):
         return watch
 
     def active_watches(self) -> Sequence[MonitoringWatch]:
-        now = _current_timestamp()
-        active = [watch for watch in self._watches.values() if watch.expires_at >= now]
-        return sorted(active, key=lambda item: item.expires_at)
+        """Return unexpired watches ordered by expiry, soonest first."""
+
+        watches = self._watches_by_expiry
+        start = bisect_left(watches, _current_timestamp(), key=_watch_expiry)
+        return watches[start:]
 
     def watch_for(self, address: str, network: Network) -> Sequence[MonitoringWatch]:
         normalized = address.lower()
@@ -314,6 +335,7 @@ class MonitoringService(QtCore.QObject):
         self._events.append(event)
         if len(self._events) > 200:
             self._events[:] = self._events[-200:]
+        self._version += 1
         self.event_recorded.emit(event)
         self._dispatch_webhook(event)
 
@@ -0,0 +1,50 @@
+"""Tests for API key resolution order."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import tempfile
+import unittest
+from unittest import mock
+
+import api_keys
+
+
+class KeyResolutionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.env_file = Path(self._tmp.name) / "api_keys.env"
+        self.env_file.write_text("ETHERSCAN_API_KEY=fromfile123456\n", encoding="utf-8")
+        self.addCleanup(api_keys.invalidate_cache)
+
+    def _resolve(self, environ: dict[str, str]) -> str | None:
+        environ = {"ARCHEBLOW_API_KEYS_FILE": str(self.env_file), **environ}
+        with mock.patch.dict(os.environ, environ):
+            api_keys.invalidate_cache()
+            return api_keys.get_api_key("etherscan")
+
+    def test_empty_environment_value_falls_back_to_env_file(self) -> None:
+        self.assertEqual(self._resolve({"ETHERSCAN_API_KEY": ""}), "fromfile123456")
+
+    def test_environment_value_takes_precedence(self) -> None:
+        self.assertEqual(self._resolve({"ETHERSCAN_API_KEY": " fromenv "}), "fromenv")
+
+    def test_unregistered_key_reads_its_environment_variable(self) -> None:
+        entry = api_keys.APIServiceKey("custom", "Custom", "MY_CUSTOM_API_KEY")
+        with mock.patch.dict(os.environ, {"MY_CUSTOM_API_KEY": "abcdefghijkl"}):
+            api_keys.invalidate_cache()
+            self.assertEqual(entry.resolve(), "abcdefghijkl")
+
+    def test_masked_uses_own_variable_for_shared_service_id(self) -> None:
+        entry = api_keys.APIServiceKey("etherscan", "Custom", "MY_CUSTOM_API_KEY")
+        environ = {"ETHERSCAN_API_KEY": "etherscan1234", "MY_CUSTOM_API_KEY": "custom5678"}
+        with mock.patch.dict(os.environ, environ):
+            api_keys.invalidate_cache()
+            self.assertEqual(entry.masked(), "cu******78")
+            self.assertEqual(api_keys.API_SERVICE_KEYS["etherscan"].masked(), "et*********34")
+
+
+if __name__ == "__main__":
+    unittest.main()